@@ -20,30 +20,22 @@ def generate_accumulated_crossings_plot(start_sec=3, end_sec=603, bin_size=150):
     print("\n--- Generating Locomotor Activity Plots ---")
 
     # 1. Load data for all animals
-    raw_data = data_loader.load_matlab_data()
-    loaded_data = {unit: data for unit, data in raw_data.items() if data is not None}
+    # Only the crossing timestamps are needed
+    loaded_data = data_loader.load_matlab_data(variable_names=data_loader.CROSSING_KEYS)
 
     if not loaded_data:
         print("Error: No data files were successfully loaded. Cannot generate plot.")
         return
 
-    # 2. Run analysis for each animal
-    all_accumulated_crossings = {}
-    all_total_crossings = {}
-    bin_centers = np.array([])
-    for unit, data in loaded_data.items():
-        accumulated_counts, bins = analysis.calculate_accumulated_crossings_in_window(
-            data, bin_size, start_sec, end_sec
-        )
-        all_accumulated_crossings[unit] = accumulated_counts
-
-        total_counts, _ = analysis.calculate_total_crossings_in_window(
-            data, bin_size, start_sec, end_sec
-        )
-        all_total_crossings[unit] = total_counts
-
-        if bin_centers.size == 0:
-            bin_centers = bins
+    # 2. Run analysis for all animals in one batch
+    all_animals = data_loader.stack_animal_data(loaded_data)
+    unit_ids, total_counts, bin_centers = analysis.calculate_crossings_for_all_animals(
+        all_animals, 'crossings', bin_size, start_sec, end_sec
+    )
+    accumulated_counts = np.cumsum(total_counts, axis=1)
+
+    all_total_crossings = dict(zip(unit_ids, total_counts))
+    all_accumulated_crossings = dict(zip(unit_ids, accumulated_counts))
 
     # 3. Plot accumulated crossings
     if all_accumulated_crossings and bin_centers.size > 0:
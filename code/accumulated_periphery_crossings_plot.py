@@ -21,28 +21,21 @@ def generate_accumulated_periphery_crossings_plot(start_sec=3, end_sec=603, bin_
     print("\n--- Generating Accumulated Periphery Crossings and Ratio Plots ---")
 
     # 1. Load data for all animals
-    raw_data = data_loader.load_matlab_data()
-    loaded_data = {unit: data for unit, data in raw_data.items() if data is not None}
+    # Only the crossing timestamps are needed
+    loaded_data = data_loader.load_matlab_data(variable_names=data_loader.CROSSING_KEYS)
 
     if not loaded_data:
         print("Error: No data files were successfully loaded. Cannot generate plot.")
         return
 
-    # 2. Run analysis for each animal
-    all_accumulated_periphery_crossings = {}
-    all_ratios = {}
-    bin_centers = np.array([])
-    for unit, data in loaded_data.items():
-        accumulated_counts, bins = analysis.calculate_accumulated_periphery_crossings_in_window(
-            data, bin_size, start_sec, end_sec
-        )
-        all_accumulated_periphery_crossings[unit] = accumulated_counts
-        if bin_centers.size == 0:
-            bin_centers = bins
-        
-        ratio = analysis.calculate_periphery_center_ratio(data, start_sec, end_sec)
-        all_ratios[unit] = ratio
+    # 2. Run analysis for each animal (animals are analyzed concurrently, one binning pass each)
+    all_metrics = analysis.analyze_animals_in_parallel(
+        loaded_data, analysis.calculate_all_metrics_for_animal, bin_size, start_sec, end_sec
+    )
 
+    all_accumulated_periphery_crossings = {unit: metrics.accumulated_periphery for unit, metrics in all_metrics.items()}
+    all_ratios = {unit: metrics.ratio for unit, metrics in all_metrics.items()}
+    bin_centers = analysis.get_bin_ends_minutes(start_sec, end_sec, bin_size)
 
     # 3. Plot accumulated periphery crossings
     if all_accumulated_periphery_crossings and bin_centers.size > 0:
@@ -0,0 +1,61 @@
+
+"""
+This module runs the per-bin Open Field analyses shared by the freezing/grooming
+and thigmotaxis dashboards in a single pass over the loaded animals.
+"""
+
+import numpy as np
+
+import data_loader
+import behavioral_analysis as analysis
+
+def compute_all(loaded_data, start_sec=3, end_sec=603, bin_size=150):
+    """
+    Computes freezing, grooming and thigmotaxis for every animal in one pass. Behavior
+    durations and crossing counts are binned for all animals at once from the stacked
+    arrays of data_loader.stack_animal_data.
+
+    The results are stored as float32: durations are bounded by the bin size and the
+    thigmotaxis index by 1, so single precision is plenty for plotting and averaging.
+
+    Args:
+        loaded_data (dict): The loaded MATLAB data for each unit (units without data excluded).
+        start_sec (int): The start time in seconds for the analysis window.
+        end_sec (int): The end time in seconds for the analysis window.
+        bin_size (int): The size of each analysis bin in seconds.
+
+    Returns:
+        dict: A dictionary with:
+            - 'unit_ids' (list): The unit IDs, in row order of the matrices below.
+            - 'freezing' (np.array): A (num_animals, num_bins) float32 matrix of freezing durations.
+            - 'grooming' (np.array): A (num_animals, num_bins) float32 matrix of grooming durations.
+            - 'thigmotaxis' (np.array): A (num_animals, num_bins) float32 matrix of thigmotaxis indices.
+            - 'bin_centers' (np.array): The end of each bin in minutes.
+    """
+    bin_centers = analysis.get_bin_ends_minutes(start_sec, end_sec, bin_size)
+    empty = np.empty((0, bin_centers.size), dtype=np.float32)
+    results = {'unit_ids': [], 'freezing': empty, 'grooming': empty, 'thigmotaxis': empty,
+               'bin_centers': bin_centers}
+    if not loaded_data:
+        return results
+
+    all_animals = data_loader.stack_animal_data(loaded_data)
+    unit_ids, freezing_durations, _ = analysis.calculate_behavior_duration_batch(all_animals, 'Freezing_start_stop', bin_size, start_sec, end_sec)
+    _, grooming_durations, _ = analysis.calculate_behavior_duration_batch(all_animals, 'grooming_start_stop', bin_size, start_sec, end_sec)
+    results['unit_ids'] = unit_ids
+    results['freezing'] = freezing_durations.astype(np.float32)
+    results['grooming'] = grooming_durations.astype(np.float32)
+
+    # Thigmotaxis from the same stacked layout, so all three metrics share the unit_ids row order
+    _, total_counts, _ = analysis.calculate_crossings_for_all_animals(all_animals, 'crossings', bin_size, start_sec, end_sec)
+    _, periphery_counts, _ = analysis.calculate_crossings_for_all_animals(all_animals, 'periph', bin_size, start_sec, end_sec)
+    results['thigmotaxis'] = analysis._thigmotaxis_from_counts(total_counts, periphery_counts).astype(np.float32)
+
+    return results
+
+def by_unit(results, metric):
+    """
+    Returns one metric of compute_all's results as a unit ID -> per-bin array dictionary, as
+    taken by the plotting functions. The arrays are row views of the result matrix, not copies.
+    """
+    return dict(zip(results['unit_ids'], results[metric]))
@@ -5,9 +5,169 @@ When run as a script, it performs all analyses and calls the plotting
 module to generate individual plots for each metric.
 """
 
+import functools
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-import data_loader
-import behavioral_plotting
+
+# fast-histogram is optional; without it, binning falls back to np.bincount
+try:
+    from fast_histogram import histogram1d
+except ImportError:
+    histogram1d = None
+
+# Every per-bin crossings metric of one animal, as returned by calculate_all_metrics_for_animal
+AnimalMetrics = namedtuple('AnimalMetrics', [
+    'total', 'periphery', 'accumulated_total', 'accumulated_periphery', 'thigmotaxis', 'ratio', 'bin_ends_minutes'
+])
+
+# --- Binning Helper Functions ---
+
+# The (start, end, bin size) window in seconds used by every orchestrator script
+_DEFAULT_WINDOW = (3, 603, 150)
+_DEFAULT_START = np.float32(_DEFAULT_WINDOW[0])
+_DEFAULT_END = np.float32(_DEFAULT_WINDOW[1])
+_DEFAULT_INV_BIN_SIZE = np.float32(1.0 / _DEFAULT_WINDOW[2])
+_DEFAULT_NUM_BINS = 4
+
+@functools.lru_cache(maxsize=None)
+def _time_bins(start_time_seconds, end_time_seconds, bin_size_seconds):
+    """
+    Returns the number of equal-width bins covering a time window and the end of each
+    bin in minutes (relative to the window start). Cached per window, so the returned
+    bin_ends_minutes array is shared and read-only.
+    """
+    duration = end_time_seconds - start_time_seconds
+    num_bins = int(-(-duration // bin_size_seconds))
+    bin_ends_minutes = (np.arange(1, num_bins + 1, dtype=np.float64) * bin_size_seconds) * (1 / 60.0)
+    bin_ends_minutes.flags.writeable = False
+    return num_bins, bin_ends_minutes
+
+def _bin_times(times, start_time_seconds, end_time_seconds, bin_size_seconds, num_bins):
+    """
+    Counts event timestamps into equal-width bins of a time window in a single pass.
+    Events before the start or at/after the end of the window are ignored. The counts are
+    returned in a freshly allocated array, which callers may modify in place.
+
+    Timestamps are binned in float32: a session lasts minutes, so single precision resolves
+    them far below the bin width while halving the memory traffic of the pass.
+    """
+    times = times.astype(np.float32, copy=False)
+    # The default window has its own specialization; fast-histogram covers other evenly divided windows
+    if (start_time_seconds, end_time_seconds, bin_size_seconds) == _DEFAULT_WINDOW:
+        return _bin_default_window(times)
+    if histogram1d is not None and start_time_seconds + num_bins * bin_size_seconds == end_time_seconds:
+        # fast-histogram drops out-of-range values itself, so the raw timestamps go straight in
+        counts = histogram1d(times, bins=num_bins, range=(start_time_seconds, end_time_seconds))
+        return counts.astype(np.intp)
+
+    idx = np.floor_divide(times - start_time_seconds, bin_size_seconds).astype(np.intp, copy=False)
+    valid = (idx >= 0) & (times < end_time_seconds)
+    return np.bincount(idx[valid], minlength=num_bins)[:num_bins]
+
+def _count_in_window(times, start_time_seconds, end_time_seconds):
+    """
+    Counts the event timestamps in [start, end) with two binary searches, instead of a
+    full-array mask. The timestamps must be in ascending order; data_loader guarantees this
+    for the crossing times it loads.
+    """
+    return int(np.searchsorted(times, end_time_seconds, side='left') - np.searchsorted(times, start_time_seconds, side='left'))
+
+def _bin_default_window(times):
+    """
+    Specialization of _bin_times for the default window (3-603 s in 150 s bins).
+    The window constants are precomputed, and the per-event division becomes a multiplication.
+    """
+    scaled = (times - _DEFAULT_START) * _DEFAULT_INV_BIN_SIZE
+    valid = (scaled >= 0) & (times < _DEFAULT_END)
+    return np.bincount(scaled[valid].astype(np.intp), minlength=_DEFAULT_NUM_BINS)[:_DEFAULT_NUM_BINS]
+
+def _bin_durations(starts, stops, start_time_seconds, bin_size_seconds, num_bins, rows=None, num_rows=1):
+    """
+    Sums the overlap of each [start, stop] interval with every equal-width bin of a time window.
+
+    Each interval is credited a full bin_size_seconds for every bin from the one holding its
+    start to the one holding its stop (a difference array, so O(intervals + bins)), and the
+    uncovered parts of its first and last bin are then subtracted.
+
+    If rows is given, interval i is accumulated into row rows[i] of a (num_rows, num_bins)
+    result instead of into a single 1D array, so many animals are binned in one pass.
+    """
+    window_end = start_time_seconds + num_bins * bin_size_seconds
+    clipped_starts = np.clip(starts, start_time_seconds, window_end)
+    clipped_stops = np.clip(stops, start_time_seconds, window_end)
+
+    # Intervals entirely outside the window collapse to zero length and are dropped
+    inside = clipped_stops > clipped_starts
+    if not inside.any():
+        # No behavior inside the window (e.g. an animal that never groomed)
+        return np.zeros((num_rows, num_bins)) if rows is not None else np.zeros(num_bins)
+    clipped_starts = clipped_starts[inside]
+    clipped_stops = clipped_stops[inside]
+
+    first_bin = np.floor_divide(clipped_starts - start_time_seconds, bin_size_seconds).astype(np.intp)
+    last_bin = np.floor_divide(clipped_stops - start_time_seconds, bin_size_seconds).astype(np.intp)
+    np.minimum(first_bin, num_bins - 1, out=first_bin)
+    np.minimum(last_bin, num_bins - 1, out=last_bin)
+
+    # Each row gets num_bins + 1 slots, so the difference array can close a run past the last bin
+    stride = num_bins + 1
+    size = num_rows * stride
+    row_offset = 0 if rows is None else rows[inside] * stride
+    first_key = row_offset + first_bin
+    last_key = row_offset + last_bin
+
+    # Number of intervals touching each bin, via a difference array
+    coverage = np.bincount(first_key, minlength=size) - np.bincount(last_key + 1, minlength=size)
+    binned_durations = np.cumsum(coverage.reshape(num_rows, stride)[:, :num_bins], axis=1) * float(bin_size_seconds)
+
+    # Remove the parts of the first and last bins that each interval does not cover
+    head_gap = clipped_starts - (start_time_seconds + first_bin * bin_size_seconds)
+    tail_gap = (start_time_seconds + (last_bin + 1) * bin_size_seconds) - clipped_stops
+    binned_durations -= np.bincount(first_key, weights=head_gap, minlength=size).reshape(num_rows, stride)[:, :num_bins]
+    binned_durations -= np.bincount(last_key, weights=tail_gap, minlength=size).reshape(num_rows, stride)[:, :num_bins]
+    return binned_durations if rows is not None else binned_durations[0]
+
+def _thigmotaxis_from_counts(total_counts, periphery_counts):
+    """
+    Computes the per-bin thigmotaxis index from total and periphery crossing counts.
+    """
+    # Bins without any crossing get an index of 0; the index is capped at 1
+    thigmotaxis_indices = np.where(total_counts > 0,
+                                   np.minimum(periphery_counts / np.maximum(total_counts, 1), 1.0),
+                                   0.0)
+    return thigmotaxis_indices
+
+def stack_by_id(data_by_id):
+    """
+    Stacks a dictionary of equal-length per-animal arrays into a single 2D array.
+
+    The values are copied exactly once, into one C-contiguous block. Row-wise selections
+    (e.g. by sex) and reductions along axis 0 then work on that block without re-stacking.
+
+    Returns:
+        tuple: A tuple containing:
+            - ids (np.array): The animal IDs, in row order.
+            - stacked (np.array): A contiguous (num_animals, num_bins) array.
+    """
+    if not data_by_id:
+        return np.array([], dtype=str), np.empty((0, 0))
+    ids = np.array(list(data_by_id.keys()))
+    stacked = np.stack(list(data_by_id.values()), axis=0)
+    return ids, stacked
+
+def get_bin_ends_minutes(start_time_seconds=3, end_time_seconds=603, bin_size_seconds=150):
+    """
+    Returns the end of each time bin of a window in minutes (relative to the window start),
+    as used for the x-axis of the plots. It depends only on the window, so callers can compute
+    it once up front instead of taking it from the first analyzed animal.
+
+    The array is cached per window and shared, so it is read-only.
+    """
+    return _time_bins(start_time_seconds, end_time_seconds, bin_size_seconds)[1]
+
+# Bin ends of the default 3-603 s window with 150-second bins used by all the dashboards
+DEFAULT_BIN_ENDS_MINUTES = get_bin_ends_minutes()
 
 # --- Analysis Functions ---
 
@@ -15,28 +175,15 @@ def calculate_thigmotaxis_in_window(animal_data, bin_size_seconds=150, start_tim
     """
     Analyzes a single animal's data to calculate the thigmotaxis index over a fixed time window.
     """
-    all_crossings = animal_data['crossing_times'].flatten()
-    periphery_crossings = animal_data['periphery_times'].flatten()
+    all_crossings = animal_data['crossing_times'].ravel()
+    periphery_crossings = animal_data['periphery_times'].ravel()
 
-    time_window_mask = (all_crossings >= start_time_seconds) & (all_crossings < end_time_seconds)
-    all_crossings_in_window = all_crossings[time_window_mask]
+    num_bins, bin_ends_minutes = _time_bins(start_time_seconds, end_time_seconds, bin_size_seconds)
 
-    periphery_mask = (periphery_crossings >= start_time_seconds) & (periphery_crossings < end_time_seconds)
-    periphery_crossings_in_window = periphery_crossings[periphery_mask]
-    
-    duration = end_time_seconds - start_time_seconds
-    bins = np.arange(0, duration + bin_size_seconds, bin_size_seconds)
-    bin_ends_minutes = bins[1:] / 60
+    total_counts = _bin_times(all_crossings, start_time_seconds, end_time_seconds, bin_size_seconds, num_bins)
+    periphery_counts = _bin_times(periphery_crossings, start_time_seconds, end_time_seconds, bin_size_seconds, num_bins)
 
-    total_counts, _ = np.histogram(all_crossings_in_window - start_time_seconds, bins=bins)
-    periphery_counts, _ = np.histogram(periphery_crossings_in_window - start_time_seconds, bins=bins)
-
-    thigmotaxis_indices = np.divide(periphery_counts, total_counts, 
-                                    out=np.full_like(total_counts, np.nan, dtype=float), 
-                                    where=total_counts!=0)
-    
-    thigmotaxis_indices = np.nan_to_num(thigmotaxis_indices, nan=0.0)
-    thigmotaxis_indices = np.minimum(thigmotaxis_indices, 1.0)
+    thigmotaxis_indices = _thigmotaxis_from_counts(total_counts, periphery_counts)
 
     return thigmotaxis_indices, bin_ends_minutes
 
@@ -44,26 +191,18 @@ def calculate_behavior_duration_in_window(animal_data, behavior_key, bin_size_se
     """
     Calculates the total duration of a specific behavior within each bin of a fixed time window.
     """
+    num_bins, bin_ends_minutes = _time_bins(start_time_seconds, end_time_seconds, bin_size_seconds)
+
     if behavior_key not in animal_data or animal_data[behavior_key].size == 0:
-        duration = end_time_seconds - start_time_seconds
-        num_bins = int(duration / bin_size_seconds)
-        bins = np.arange(0, duration + bin_size_seconds, bin_size_seconds)
-        bin_ends_minutes = bins[1:] / 60
         return np.zeros(num_bins), bin_ends_minutes
 
     behavior_times = animal_data[behavior_key]
-    duration = end_time_seconds - start_time_seconds
-    bins = np.arange(start_time_seconds, end_time_seconds + bin_size_seconds, bin_size_seconds)
-    binned_durations = np.zeros(len(bins) - 1)
-
-    for i in range(len(bins) - 1):
-        bin_start, bin_end = bins[i], bins[i+1]
-        overlap_start = np.maximum(behavior_times[0, :], bin_start)
-        overlap_end = np.minimum(behavior_times[1, :], bin_end)
-        overlap_duration = np.maximum(0, overlap_end - overlap_start)
-        binned_durations[i] = np.sum(overlap_duration)
-        
-    bin_ends_minutes = (bins[1:] - start_time_seconds) / 60
+
+    # Row 0 holds the start times and row 1 the stop times of each behavior event.
+    # MATLAB arrays load in Fortran order, so the block is converted to C order once,
+    # leaving both rows as contiguous views for the vectorized kernel.
+    starts, stops = np.ascontiguousarray(behavior_times, dtype=np.float32)
+    binned_durations = _bin_durations(starts, stops, start_time_seconds, bin_size_seconds, num_bins)
     
     return binned_durations, bin_ends_minutes
 
@@ -82,19 +221,13 @@ def calculate_total_crossings_in_window(animal_data, bin_size_seconds=150, start
             - total_counts (np.array): The number of crossings in each bin.
             - bin_ends_minutes (np.array): The end of each time bin in minutes, for the x-axis.
     """
-    all_crossings = animal_data['crossing_times'].flatten()
+    all_crossings = animal_data['crossing_times'].ravel()
 
-    # Filter crossings to be within the specified time window
-    time_window_mask = (all_crossings >= start_time_seconds) & (all_crossings < end_time_seconds)
-    all_crossings_in_window = all_crossings[time_window_mask]
-    
-    # Create time bins relative to the start time
-    duration = end_time_seconds - start_time_seconds
-    bins = np.arange(0, duration + bin_size_seconds, bin_size_seconds)
-    bin_ends_minutes = bins[1:] / 60
+    # Number of equal-width time bins covering the window
+    num_bins, bin_ends_minutes = _time_bins(start_time_seconds, end_time_seconds, bin_size_seconds)
 
-    # Adjust timestamps to be relative to the start of the window for binning
-    total_counts, _ = np.histogram(all_crossings_in_window - start_time_seconds, bins=bins)
+    # Filter to the time window and bin in a single pass over the timestamps
+    total_counts = _bin_times(all_crossings, start_time_seconds, end_time_seconds, bin_size_seconds, num_bins)
     
     return total_counts, bin_ends_minutes
 
@@ -116,7 +249,8 @@ def calculate_accumulated_crossings_in_window(animal_data, bin_size_seconds=150,
     total_counts, bin_ends_minutes = calculate_total_crossings_in_window(
         animal_data, bin_size_seconds, start_time_seconds, end_time_seconds
     )
-    accumulated_counts = np.cumsum(total_counts)
+    # total_counts is not returned, so its buffer is reused for the running sum
+    accumulated_counts = np.cumsum(total_counts, out=total_counts)
     return accumulated_counts, bin_ends_minutes
 
 def calculate_periphery_crossings_in_window(animal_data, bin_size_seconds=150, start_time_seconds=3, end_time_seconds=603):
@@ -134,19 +268,13 @@ def calculate_periphery_crossings_in_window(animal_data, bin_size_seconds=150, s
             - periphery_counts (np.array): The number of periphery crossings in each bin.
             - bin_ends_minutes (np.array): The end of each time bin in minutes, for the x-axis.
     """
-    periphery_crossings = animal_data['periphery_times'].flatten()
+    periphery_crossings = animal_data['periphery_times'].ravel()
 
-    # Filter crossings to be within the specified time window
-    time_window_mask = (periphery_crossings >= start_time_seconds) & (periphery_crossings < end_time_seconds)
-    periphery_crossings_in_window = periphery_crossings[time_window_mask]
-    
-    # Create time bins relative to the start time
-    duration = end_time_seconds - start_time_seconds
-    bins = np.arange(0, duration + bin_size_seconds, bin_size_seconds)
-    bin_ends_minutes = bins[1:] / 60
+    # Number of equal-width time bins covering the window
+    num_bins, bin_ends_minutes = _time_bins(start_time_seconds, end_time_seconds, bin_size_seconds)
 
-    # Adjust timestamps to be relative to the start of the window for binning
-    periphery_counts, _ = np.histogram(periphery_crossings_in_window - start_time_seconds, bins=bins)
+    # Filter to the time window and bin in a single pass over the timestamps
+    periphery_counts = _bin_times(periphery_crossings, start_time_seconds, end_time_seconds, bin_size_seconds, num_bins)
     
     return periphery_counts, bin_ends_minutes
 
@@ -168,9 +296,141 @@ def calculate_accumulated_periphery_crossings_in_window(animal_data, bin_size_se
     periphery_counts, bin_ends_minutes = calculate_periphery_crossings_in_window(
         animal_data, bin_size_seconds, start_time_seconds, end_time_seconds
     )
-    accumulated_periphery_counts = np.cumsum(periphery_counts)
+    # periphery_counts is not returned, so its buffer is reused for the running sum
+    accumulated_periphery_counts = np.cumsum(periphery_counts, out=periphery_counts)
     return accumulated_periphery_counts, bin_ends_minutes
 
+def calculate_all_metrics_for_animal(animal_data, bin_size_seconds=150, start_time_seconds=3, end_time_seconds=603):
+    """
+    Calculates every crossings-based metric of one animal from a single binning pass per array.
+
+    The total and periphery crossings are each binned once, and the accumulated counts,
+    thigmotaxis index and periphery/center ratio are all derived from those two histograms.
+    Use this when several metrics are needed for the same animal, instead of calling the
+    individual calculate_* functions (each of which re-scans the timestamps).
+
+    Args:
+        animal_data (dict): The raw data for one animal, as loaded from its .mat file.
+        bin_size_seconds (int): The size of each time bin in seconds.
+        start_time_seconds (int): The start of the analysis window in seconds.
+        end_time_seconds (int): The end of the analysis window in seconds.
+
+    Returns:
+        AnimalMetrics: A named tuple with the per-bin total, periphery, accumulated_total,
+            accumulated_periphery and thigmotaxis arrays, the window-wide periphery/center
+            ratio, and bin_ends_minutes for the x-axis.
+    """
+    num_bins, bin_ends_minutes = _time_bins(start_time_seconds, end_time_seconds, bin_size_seconds)
+
+    total_counts = _bin_times(animal_data['crossing_times'].ravel(), start_time_seconds, end_time_seconds, bin_size_seconds, num_bins)
+    periphery_counts = _bin_times(animal_data['periphery_times'].ravel(), start_time_seconds, end_time_seconds, bin_size_seconds, num_bins)
+
+    ratio = calculate_periphery_center_ratio(
+        animal_data, start_time_seconds, end_time_seconds, total_counts, periphery_counts
+    )
+
+    return AnimalMetrics(
+        total=total_counts,
+        periphery=periphery_counts,
+        accumulated_total=np.cumsum(total_counts),
+        accumulated_periphery=np.cumsum(periphery_counts),
+        thigmotaxis=_thigmotaxis_from_counts(total_counts, periphery_counts),
+        ratio=ratio,
+        bin_ends_minutes=bin_ends_minutes,
+    )
+
+def calculate_crossings_for_all_animals(all_animals, times_field='crossings', bin_size_seconds=150, start_time_seconds=3, end_time_seconds=603):
+    """
+    Calculates the number of crossings in each bin of a fixed time window for all animals at once.
+
+    The padded timestamp matrix of all animals is binned with a single np.bincount, using
+    (animal index * num_bins + bin index) as the key, instead of one histogram per animal.
+
+    Args:
+        all_animals (data_loader.AllAnimals): All animals' data, from data_loader.stack_animal_data.
+        times_field (str): The timestamp matrix to bin ('crossings' or 'periph').
+        bin_size_seconds (int): The size of each time bin in seconds.
+        start_time_seconds (int): The start of the analysis window in seconds.
+        end_time_seconds (int): The end of the analysis window in seconds.
+
+    Returns:
+        tuple: A tuple containing:
+            - unit_ids (list): The unit IDs, in the row order of counts.
+            - counts (np.array): A (num_animals, num_bins) array of crossings per bin.
+            - bin_ends_minutes (np.array): The end of each time bin in minutes, for the x-axis.
+    """
+    times = getattr(all_animals, times_field)
+    num_animals = times.shape[0]
+    num_bins, bin_ends_minutes = _time_bins(start_time_seconds, end_time_seconds, bin_size_seconds)
+
+    # The +inf padding fails the end-of-window test, so only real events are binned
+    valid = (times >= start_time_seconds) & (times < end_time_seconds)
+    animal_idx, _ = np.nonzero(valid)
+    bin_idx = np.floor_divide(times[valid] - start_time_seconds, bin_size_seconds).astype(np.intp)
+    flat_idx = animal_idx * num_bins + bin_idx
+    counts = np.bincount(flat_idx, minlength=num_animals * num_bins)[:num_animals * num_bins]
+
+    return list(all_animals.ids), counts.reshape(num_animals, num_bins), bin_ends_minutes
+
+def calculate_behavior_duration_batch(all_animals, behavior_key, bin_size_seconds=150, start_time_seconds=3, end_time_seconds=603):
+    """
+    Calculates the total duration of a behavior within each bin of a fixed time window for all animals at once.
+
+    The padded start/stop intervals of all animals go through one difference-array pass, keyed
+    by animal row, instead of one call per animal. Intervals that span bin edges are split
+    between the bins they overlap, exactly as in calculate_behavior_duration_in_window.
+
+    Args:
+        all_animals (data_loader.AllAnimals): All animals' data, from data_loader.stack_animal_data.
+        behavior_key (str): The behavior to measure ('Freezing_start_stop' or 'grooming_start_stop').
+        bin_size_seconds (int): The size of each time bin in seconds.
+        start_time_seconds (int): The start of the analysis window in seconds.
+        end_time_seconds (int): The end of the analysis window in seconds.
+
+    Returns:
+        tuple: A tuple containing:
+            - unit_ids (list): The unit IDs, in the row order of durations.
+            - durations (np.array): A (num_animals, num_bins) array of behavior seconds per bin.
+            - bin_ends_minutes (np.array): The end of each time bin in minutes, for the x-axis.
+    """
+    intervals = all_animals.behaviors[behavior_key]
+    num_animals, _, max_events = intervals.shape
+    num_bins, bin_ends_minutes = _time_bins(start_time_seconds, end_time_seconds, bin_size_seconds)
+    if max_events == 0:
+        return list(all_animals.ids), np.zeros((num_animals, num_bins)), bin_ends_minutes
+
+    # The +inf padding clips to a zero-length interval at the window end and is dropped
+    rows = np.repeat(np.arange(num_animals), max_events)
+    durations = _bin_durations(intervals[:, 0, :].ravel(), intervals[:, 1, :].ravel(),
+                               start_time_seconds, bin_size_seconds, num_bins,
+                               rows=rows, num_rows=num_animals)
+
+    return list(all_animals.ids), durations, bin_ends_minutes
+
+def calculate_mean_by_sex(ids, stacked):
+    """
+    Calculates the per-bin mean over all males and over all females of a stacked metric.
+
+    Args:
+        ids (list): The animal IDs, in row order.
+        stacked (np.array): A (num_animals, num_bins) array of per-bin values.
+
+    Returns:
+        tuple: A tuple containing:
+            - male_mean (np.array): The mean value for males for each bin.
+            - female_mean (np.array): The mean value for females for each bin.
+        A sex without any animals gets zeros, like a missing animal in the group plots.
+    """
+    ids = np.asarray(ids, dtype=str)
+    male_mask = np.char.startswith(ids, 'M')
+    female_mask = np.char.startswith(ids, 'F')
+    num_bins = stacked.shape[1]
+
+    male_mean = stacked[male_mask].mean(axis=0) if male_mask.any() else np.zeros(num_bins)
+    female_mean = stacked[female_mask].mean(axis=0) if female_mask.any() else np.zeros(num_bins)
+
+    return male_mean, female_mean
+
 def calculate_mean_thigmotaxis_by_sex(all_thigmotaxis_data):
     """
     Calculates the mean thigmotaxis index for all males and all females.
@@ -182,30 +442,28 @@ def calculate_mean_thigmotaxis_by_sex(all_thigmotaxis_data):
         tuple: A tuple containing:
             - male_mean (np.array): The mean thigmotaxis index for males for each bin.
             - female_mean (np.array): The mean thigmotaxis index for females for each bin.
+        A sex without any animals gets zeros, like a missing animal in the group plots.
     """
-    male_data = [data for animal_id, data in all_thigmotaxis_data.items() if animal_id.startswith('M')]
-    female_data = [data for animal_id, data in all_thigmotaxis_data.items() if animal_id.startswith('F')]
-
-    male_mean = np.mean(male_data, axis=0)
-    female_mean = np.mean(female_data, axis=0)
+    return calculate_mean_by_sex(*stack_by_id(all_thigmotaxis_data))
 
-    return male_mean, female_mean
-
-def calculate_periphery_center_ratio(animal_data, start_time_seconds=3, end_time_seconds=603):
+def calculate_periphery_center_ratio(animal_data, start_time_seconds=3, end_time_seconds=603,
+                                     total_counts=None, periphery_counts=None):
     """
     Calculates the ratio of periphery crossings to center crossings over a fixed time window.
-    """
-    all_crossings = animal_data['crossing_times'].flatten()
-    periphery_crossings = animal_data['periphery_times'].flatten()
 
-    time_window_mask = (all_crossings >= start_time_seconds) & (all_crossings < end_time_seconds)
-    all_crossings_in_window = all_crossings[time_window_mask]
+    If the binned total_counts and periphery_counts of the same window are already available
+    (e.g. from calculate_total_crossings_in_window), pass them in: the ratio is then derived
+    from their sums without re-scanning the timestamps in animal_data.
+    """
+    if total_counts is not None and periphery_counts is not None:
+        total_crossings_count = int(total_counts.sum())
+        periphery_crossings_count = int(periphery_counts.sum())
+    else:
+        all_crossings = animal_data['crossing_times'].ravel()
+        periphery_crossings = animal_data['periphery_times'].ravel()
 
-    periphery_mask = (periphery_crossings >= start_time_seconds) & (periphery_crossings < end_time_seconds)
-    periphery_crossings_in_window = periphery_crossings[periphery_mask]
-    
-    total_crossings_count = len(all_crossings_in_window)
-    periphery_crossings_count = len(periphery_crossings_in_window)
+        total_crossings_count = _count_in_window(all_crossings, start_time_seconds, end_time_seconds)
+        periphery_crossings_count = _count_in_window(periphery_crossings, start_time_seconds, end_time_seconds)
     
     center_crossings_count = max(total_crossings_count - periphery_crossings_count, 1)
     
@@ -213,13 +471,37 @@ def calculate_periphery_center_ratio(animal_data, start_time_seconds=3, end_time
     
     return ratio
 
+# --- Parallel Execution Helper ---
+
+def analyze_animals_in_parallel(loaded_data, analysis_fn, *args):
+    """
+    Runs an analysis function on every animal concurrently.
+
+    The analyses spend their time in NumPy routines that release the GIL, so a thread pool
+    lets the per-animal work overlap without the pickling cost of separate processes.
+
+    Args:
+        loaded_data (dict): The raw data for each animal, keyed by unit ID.
+        analysis_fn (callable): Called as analysis_fn(animal_data, *args) for each animal.
+
+    Returns:
+        dict: The result of analysis_fn for each unit ID, in the order of loaded_data.
+    """
+    with ThreadPoolExecutor() as executor:
+        results = executor.map(lambda animal_data: analysis_fn(animal_data, *args), loaded_data.values())
+        return dict(zip(loaded_data.keys(), results))
+
 # --- Main Execution Block ---
 
 if __name__ == '__main__':
-    
+    # Imported here so that importing the analysis functions does not pull in
+    # pandas/scipy (data loading) or matplotlib (plotting)
+    import data_loader
+    import analysis_pipeline
+    import behavioral_plotting
+
     # 1. Load data
-    raw_data = data_loader.load_matlab_data()
-    loaded_data = {unit: data for unit, data in raw_data.items() if data is not None}
+    loaded_data = data_loader.load_matlab_data()
 
     if not loaded_data:
         print("Error: No data files were successfully loaded.")
@@ -228,26 +510,12 @@ if __name__ == '__main__':
         start_sec, end_sec = 3, 603
         bin_size = 150
 
-        # 3. Run all analyses
+        # 3. Run all analyses (one shared pass, the same as the dashboards)
         print("--- Running Analyses ---")
-        analyzed_thigmotaxis = {}
-        analyzed_freezing = {}
-        analyzed_grooming = {}
-        bin_centers = np.array([])
-
-        for unit, data in loaded_data.items():
-            # Thigmotaxis
-            indices, bins = calculate_thigmotaxis_in_window(data, bin_size, start_sec, end_sec)
-            analyzed_thigmotaxis[unit] = indices
-            if bin_centers.size == 0 and bins.size > 0:
-                bin_centers = bins
-            # Freezing
-            durations, _ = calculate_behavior_duration_in_window(data, 'Freezing_start_stop', bin_size, start_sec, end_sec)
-            analyzed_freezing[unit] = durations
-            # Grooming
-            durations, _ = calculate_behavior_duration_in_window(data, 'grooming_start_stop', bin_size, start_sec, end_sec)
-            analyzed_grooming[unit] = durations
-        
+        results = analysis_pipeline.compute_all(loaded_data, start_sec, end_sec, bin_size)
+        analyzed_thigmotaxis = analysis_pipeline.by_unit(results, 'thigmotaxis')
+        bin_centers = DEFAULT_BIN_ENDS_MINUTES
+
         print("Analysis complete.")
 
         # 4. Generate plots using the plotting module
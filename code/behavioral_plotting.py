@@ -4,23 +4,93 @@ This module provides functions for plotting the analyzed experimental data.
 Each function generates and saves a single plot.
 """
 
-import numpy as np
-import matplotlib.pyplot as plt
+import functools
+import multiprocessing
 import os
+import numpy as np
+
+# Plots are only saved by default; set SHOW_PLOTS=1 to also open them in a window.
+SHOW = os.environ.get('SHOW_PLOTS', '0') == '1'
 
 # --- Plotting Helper Functions ---
 
+def _pyplot():
+    """
+    Imports and returns matplotlib.pyplot on first use, so importing this module stays cheap.
+    Unless SHOW is set, the non-interactive Agg backend is selected so batch runs and worker
+    processes need no display.
+    """
+    import matplotlib
+    if not SHOW:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+_COLOR_MAP = {
+    'B': {'M': 'darkblue', 'F': 'cornflowerblue'},
+    'R': {'M': 'darkred', 'F': 'lightcoral'},
+    'G': {'M': 'darkgreen', 'F': 'limegreen'},
+    'W': {'M': 'dimgray', 'F': 'silver'}
+}
+
+# Major x ticks (minutes) shared by the time-binned plots
+_XTICKS = np.arange(0, 10.1, 2.5)
+
+@functools.lru_cache(maxsize=None)
 def get_plot_color(animal_id):
     """Helper function to determine plot color based on animal ID."""
-    sex = animal_id[0]
-    color_code = animal_id[1]
-    color_map = {
-        'B': {'M': 'darkblue', 'F': 'cornflowerblue'},
-        'R': {'M': 'darkred', 'F': 'lightcoral'},
-        'G': {'M': 'darkgreen', 'F': 'limegreen'},
-        'W': {'M': 'dimgray', 'F': 'silver'}
-    }
-    return color_map.get(color_code, {}).get(sex, 'black')
+    return _COLOR_MAP.get(animal_id[1], {}).get(animal_id[0], 'black')
+
+def _draw_animal_lines(ax, all_animals_data, bin_ends_minutes, rasterized=False):
+    """
+    Draws one marker line per animal using a single LineCollection and a single scatter.
+
+    Args:
+        ax (matplotlib.axes.Axes): Axes to draw on.
+        all_animals_data (dict): Animal ID -> per-bin values.
+        bin_ends_minutes (np.array): X positions shared by every animal.
+        rasterized (bool): Rasterize the data artists when saving.
+
+    Returns:
+        list: Proxy Line2D handles (one per animal) for ax.legend.
+    """
+    from matplotlib.collections import LineCollection
+    from matplotlib.lines import Line2D
+
+    animal_ids = list(all_animals_data.keys())
+    if not animal_ids:
+        return []
+
+    values = np.stack([all_animals_data[animal_id] for animal_id in animal_ids])
+    x = np.broadcast_to(bin_ends_minutes, values.shape)
+    colors = [get_plot_color(animal_id) for animal_id in animal_ids]
+    is_female = [animal_id.startswith('F') for animal_id in animal_ids]
+    mfc = ['white' if female else color for female, color in zip(is_female, colors)]
+    mec = ['black' if female else color for female, color in zip(is_female, colors)]
+
+    lines = LineCollection(np.stack([x, values], axis=-1), colors=colors, linestyles='-', linewidths=1.5)
+    lines.set_rasterized(rasterized)
+    ax.add_collection(lines)
+    # Markers sit above the lines, matching the draw order of individual ax.plot calls.
+    n_bins = values.shape[1]
+    ax.scatter(x.ravel(), values.ravel(), s=8 ** 2, marker='o', linewidths=1.5, zorder=2.5,
+               facecolors=np.repeat(mfc, n_bins), edgecolors=np.repeat(mec, n_bins), rasterized=rasterized)
+
+    return [Line2D([0], [0], marker='o', linestyle='-', label=animal_id, color=color,
+                   markerfacecolor=f, markeredgecolor=e, markersize=8, markeredgewidth=1.5)
+            for animal_id, color, f, e in zip(animal_ids, colors, mfc, mec)]
+
+def _style_line_axes(ax, title, ylabel):
+    """
+    Applies the shared title, labels, x-axis range and grid of the all-animal line plots.
+    """
+    ax.set_title(title, fontsize=20, fontweight='bold', pad=20)
+    ax.set_xlabel('Time (minutes)', fontsize=16)
+    ax.set_ylabel(ylabel, fontsize=16)
+    ax.set_xticks(_XTICKS)
+    ax.set_xlim(0, 10.3)
+    ax.minorticks_on()
+    ax.grid(which='major', linestyle='--', linewidth='0.5', color='gray')
 
 # --- Individual Plotting Functions (All 8 Animals) ---
 
@@ -28,41 +98,73 @@ def plot_thigmotaxis(all_animals_data, bin_ends_minutes):
     """
     Creates, saves, and shows a plot for Thigmotaxis Index for all animals.
     """
+    plt = _pyplot()
     fig, ax = plt.subplots(figsize=(12, 8))
     
-    for animal_id, indices in all_animals_data.items():
-        color = get_plot_color(animal_id)
-        is_female = animal_id.startswith('F')
-        
-        mfc = 'white' if is_female else color
-        mec = 'black' if is_female else color
+    handles = _draw_animal_lines(ax, all_animals_data, bin_ends_minutes)
 
-        ax.plot(bin_ends_minutes, indices, marker='o', linestyle='-', label=animal_id, color=color,
-                markerfacecolor=mfc, markeredgecolor=mec, markersize=8, markeredgewidth=1.5)
-
-    ax.set_title('Thigmotaxis Index Over a 10-Minute Window', fontsize=20, fontweight='bold', pad=20)
-    ax.set_xlabel('Time (minutes)', fontsize=16)
-    ax.set_ylabel('Thigmotaxis Index', fontsize=16)
+    _style_line_axes(ax, 'Thigmotaxis Index Over a 10-Minute Window', 'Thigmotaxis Index')
     ax.set_ylim(0, 1.05)
-    ax.set_xticks(np.arange(0, 10.1, 2.5))
-    ax.set_xlim(0, 10.3)
-    ax.minorticks_on()
-    ax.grid(which='major', linestyle='--', linewidth='0.5', color='gray')
-    ax.legend(title='Animal ID', loc='best', bbox_to_anchor=(0.2, 0.8), fontsize=12, title_fontsize=14)
+    ax.legend(handles=handles, title='Animal ID', loc='best', bbox_to_anchor=(0.2, 0.8), fontsize=12, title_fontsize=14)
     
     fig.tight_layout(rect=[0, 0, 0.85, 1])
 
-    if not os.path.exists('../plots'):
-        os.makedirs('../plots')
+    os.makedirs('../plots', exist_ok=True)
     plt.savefig('../plots/thigmotaxis_over_time_10min.png', dpi=300)
     print("Plot saved to 'plots/thigmotaxis_over_time_10min.png'")
-    plt.show()
+    if SHOW:
+        plt.show()
 
 # --- Grouped Comparison Plotting Functions (Male vs Female) ---
 
-def draw_total_crossings_on_ax(ax, data_male, data_female, bin_ends_minutes, group_name):
+def _render_one_group(args):
     """
-    Draws total line crossings for a male/female pair on a given Axes object (bar chart).
+    Renders and saves a single per-group figure. Top-level so it can be sent to a worker process.
+
+    Args:
+        args (tuple): (draw_fn, draw_args, filename) where draw_fn(ax, *draw_args) draws the plot.
+    """
+    draw_fn, draw_args, filename = args
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(10, 7))
+    draw_fn(ax, *draw_args)
+    fig.tight_layout()
+    fig.savefig(filename, dpi=300)
+    if SHOW:
+        plt.show()
+    plt.close(fig)
+    return filename
+
+def _render_groups(jobs):
+    """
+    Renders the per-group figures concurrently, one worker process per color group.
+    With SHOW set they are rendered one after another in this process instead, so each
+    plot can be opened in a window.
+
+    Args:
+        jobs (list): Argument tuples for _render_one_group.
+    """
+    if SHOW:
+        for filename in map(_render_one_group, jobs):
+            print(f"Plot saved to '{filename}'")
+        return
+    with multiprocessing.Pool(min(4, len(jobs))) as p:
+        for filename in p.map(_render_one_group, jobs):
+            print(f"Plot saved to '{filename}'")
+
+def _draw_paired_bars_on_ax(ax, data_male, data_female, bin_ends_minutes, group_name, title_fmt, ylabel, ylim=None):
+    """
+    Draws side-by-side male/female bars per time bin on a given Axes object.
+
+    Args:
+        ax (matplotlib.axes.Axes): Axes to draw on.
+        data_male (np.array): Per-bin values of the male animal.
+        data_female (np.array): Per-bin values of the female animal.
+        bin_ends_minutes (np.array): Bar positions (end of each bin, in minutes).
+        group_name (str): Color group name (e.g., 'Blue').
+        title_fmt (str): Title format string with a {group_name} field.
+        ylabel (str): Y-axis label.
+        ylim (tuple): Fixed y-axis limits; if None, scaled to 1.15x the largest bar.
     """
     group_code_char = group_name[0]
     male_id = f'M{group_code_char}' 
@@ -72,101 +174,84 @@ def draw_total_crossings_on_ax(ax, data_male, data_female, bin_ends_minutes, gro
     color_female = get_plot_color(female_id)
 
     bar_width = 0.8
-    x = np.arange(len(bin_ends_minutes))
+    half_w = bar_width * 0.5
+    x_left = bin_ends_minutes - half_w
+    x_right = bin_ends_minutes + half_w
 
-    ax.bar(bin_ends_minutes - bar_width/2, data_male, bar_width, label=f'Male', color=color_male)
-    ax.bar(bin_ends_minutes + bar_width/2, data_female, bar_width, label=f'Female', color=color_female)
+    ax.bar(x_left, data_male, bar_width, label=f'Male', color=color_male)
+    ax.bar(x_right, data_female, bar_width, label=f'Female', color=color_female)
 
-    ax.set_title(f'Total Crossings: {group_name} Group', fontsize=18, fontweight='bold')
+    ax.set_title(title_fmt.format(group_name=group_name), fontsize=18, fontweight='bold')
     ax.set_xlabel('Time (minutes)', fontsize=14)
-    ax.set_ylabel('Total Crossings', fontsize=14)
-    ax.set_xticks(np.arange(0, 10.1, 2.5))
+    ax.set_ylabel(ylabel, fontsize=14)
+    ax.set_xticks(_XTICKS)
     ax.set_xlim(0, 11)
-    
-    max_y = max(np.max(data_male) if data_male.size > 0 else 0, np.max(data_female) if data_female.size > 0 else 0)
-    ax.set_ylim(0, max_y * 1.15 if max_y > 0 else 10)
+
+    if ylim is None:
+        max_y = max(np.max(data_male) if data_male.size > 0 else 0, np.max(data_female) if data_female.size > 0 else 0)
+        ylim = (0, max_y * 1.15 if max_y > 0 else 10)
+    ax.set_ylim(*ylim)
     ax.grid(which='major', linestyle='--', linewidth='0.5', color='gray', axis='y')
     ax.legend(fontsize=12)
 
-def plot_total_crossings_by_group(all_crossings_data, bin_ends_minutes):
+def _plot_paired_bars_by_group(all_data, bin_ends_minutes, title_fmt, ylabel, outdir, file_prefix, ylim=None):
     """
-    Creates, saves, and shows serial plots of total crossings, one for each color group.
+    Creates and saves one paired male/female bar plot per color group, rendered in a process pool.
+
+    Args:
+        all_data (dict): Animal ID -> per-bin values.
+        bin_ends_minutes (np.array): Bar positions (end of each bin, in minutes).
+        title_fmt (str): Title format string with a {group_name} field.
+        ylabel (str): Y-axis label.
+        outdir (str): Output directory for the PNG files.
+        file_prefix (str): File name prefix; files are saved as {file_prefix}_group_{color}.png.
+        ylim (tuple): Fixed y-axis limits; if None, scaled to the data of each group.
     """
-    print("\n--- Generating Total Crossings Plots (by Group) ---")
     color_groups = ['B', 'R', 'G', 'W']
     group_names = {'B': 'Blue', 'R': 'Red', 'G': 'Green', 'W': 'White'}
 
+    os.makedirs(outdir, exist_ok=True)
+    jobs = []
     for group_code in color_groups:
-        fig, ax = plt.subplots(figsize=(10, 7))
-        male_id = f'M{group_code}'
-        female_id = f'F{group_code}'
-        
-        male_crossings = all_crossings_data.get(male_id, np.zeros(len(bin_ends_minutes)))
-        female_crossings = all_crossings_data.get(female_id, np.zeros(len(bin_ends_minutes)))
-        
+        male_data = all_data.get(f'M{group_code}', np.zeros(len(bin_ends_minutes)))
+        female_data = all_data.get(f'F{group_code}', np.zeros(len(bin_ends_minutes)))
+
         group_name = group_names[group_code]
-        draw_total_crossings_on_ax(ax, male_crossings, female_crossings, bin_ends_minutes, group_name)
-        
-        fig.tight_layout()
-        filename = f'../plots/total_crossings/total_crossings_group_{group_name.lower()}.png'
-        if not os.path.exists('../plots/total_crossings'):
-            os.makedirs('../plots/total_crossings', exist_ok=True)
-        plt.savefig(filename, dpi=300)
-        print(f"Plot saved to '{filename}'")
-        plt.show()
+        filename = f'{outdir}/{file_prefix}_group_{group_name.lower()}.png'
+        jobs.append((_draw_paired_bars_on_ax,
+                     (male_data, female_data, bin_ends_minutes, group_name, title_fmt, ylabel, ylim), filename))
 
-def draw_thigmotaxis_on_ax(ax, data_male, data_female, bin_ends_minutes, group_name):
+    _render_groups(jobs)
+
+def draw_total_crossings_on_ax(ax, data_male, data_female, bin_ends_minutes, group_name):
     """
-    Draws thigmotaxis index for a male/female pair on a given Axes object (bar chart).
+    Draws total line crossings for a male/female pair on a given Axes object (bar chart).
     """
-    group_code_char = group_name[0]
-    male_id = f'M{group_code_char}' 
-    female_id = f'F{group_code_char}'
-    
-    color_male = get_plot_color(male_id)
-    color_female = get_plot_color(female_id)
-
-    bar_width = 0.8
-    x = np.arange(len(bin_ends_minutes))
+    _draw_paired_bars_on_ax(ax, data_male, data_female, bin_ends_minutes, group_name,
+                            'Total Crossings: {group_name} Group', 'Total Crossings')
 
-    ax.bar(bin_ends_minutes - bar_width/2, data_male, bar_width, label=f'Male', color=color_male)
-    ax.bar(bin_ends_minutes + bar_width/2, data_female, bar_width, label=f'Female', color=color_female)
+def plot_total_crossings_by_group(all_crossings_data, bin_ends_minutes):
+    """
+    Creates and saves one plot of total crossings per color group, rendered in a process pool.
+    """
+    print("\n--- Generating Total Crossings Plots (by Group) ---")
+    _plot_paired_bars_by_group(all_crossings_data, bin_ends_minutes, 'Total Crossings: {group_name} Group',
+                               'Total Crossings', '../plots/total_crossings', 'total_crossings')
 
-    ax.set_title(f'Thigmotaxis Index: {group_name} Group', fontsize=18, fontweight='bold')
-    ax.set_xlabel('Time (minutes)', fontsize=14)
-    ax.set_ylabel('Thigmotaxis Index', fontsize=14)
-    ax.set_ylim(0, 1.05)
-    ax.set_xticks(np.arange(0, 10.1, 2.5))
-    ax.set_xlim(0, 11)
-    ax.grid(which='major', linestyle='--', linewidth='0.5', color='gray', axis='y')
-    ax.legend(fontsize=12)
+def draw_thigmotaxis_on_ax(ax, data_male, data_female, bin_ends_minutes, group_name):
+    """
+    Draws thigmotaxis index for a male/female pair on a given Axes object (bar chart).
+    """
+    _draw_paired_bars_on_ax(ax, data_male, data_female, bin_ends_minutes, group_name,
+                            'Thigmotaxis Index: {group_name} Group', 'Thigmotaxis Index', ylim=(0, 1.05))
 
 def plot_thigmotaxis_by_group(all_thigmotaxis_data, bin_ends_minutes):
     """
-    Creates, saves, and shows serial plots of thigmotaxis index, one for each color group.
+    Creates and saves one plot of thigmotaxis index per color group, rendered in a process pool.
     """
     print("\n--- Generating Thigmotaxis Index Plots (by Group) ---")
-    color_groups = ['B', 'R', 'G', 'W']
-    group_names = {'B': 'Blue', 'R': 'Red', 'G': 'Green', 'W': 'White'}
-
-    for group_code in color_groups:
-        fig, ax = plt.subplots(figsize=(10, 7))
-        male_id = f'M{group_code}'
-        female_id = f'F{group_code}'
-        
-        male_data = all_thigmotaxis_data.get(male_id, np.zeros(len(bin_ends_minutes)))
-        female_data = all_thigmotaxis_data.get(female_id, np.zeros(len(bin_ends_minutes)))
-        
-        group_name = group_names[group_code]
-        draw_thigmotaxis_on_ax(ax, male_data, female_data, bin_ends_minutes, group_name)
-
-        fig.tight_layout()
-        filename = f'../plots/thigmotaxis/thigmotaxis_group_{group_name.lower()}.png'
-        if not os.path.exists('../plots/thigmotaxis'):
-            os.makedirs('../plots/thigmotaxis', exist_ok=True)
-        plt.savefig(filename, dpi=300)
-        print(f"Plot saved to '{filename}'")
-        plt.show()
+    _plot_paired_bars_by_group(all_thigmotaxis_data, bin_ends_minutes, 'Thigmotaxis Index: {group_name} Group',
+                               'Thigmotaxis Index', '../plots/thigmotaxis', 'thigmotaxis', ylim=(0, 1.05))
 
 def draw_freezing_grooming_on_ax(ax, data_male_f, data_female_f, data_male_g, data_female_g, bin_ends_minutes, group_name):
     """
@@ -180,17 +265,17 @@ def draw_freezing_grooming_on_ax(ax, data_male_f, data_female_f, data_male_g, da
     color_female = get_plot_color(female_id)
 
     bar_width = 0.5
-    x = bin_ends_minutes
+    x_male_f, x_female_f, x_male_g, x_female_g = bin_ends_minutes + np.array([[-1.5], [-0.5], [0.5], [1.5]]) * bar_width
 
-    ax.bar(x - 1.5*bar_width, data_male_f, bar_width, label='Male Freezing', color=color_male, hatch='//')
-    ax.bar(x - 0.5*bar_width, data_female_f, bar_width, label='Female Freezing', color=color_female, hatch='//')
-    ax.bar(x + 0.5*bar_width, data_male_g, bar_width, label='Male Grooming', color=color_male)
-    ax.bar(x + 1.5*bar_width, data_female_g, bar_width, label='Female Grooming', color=color_female)
+    ax.bar(x_male_f, data_male_f, bar_width, label='Male Freezing', color=color_male, hatch='//')
+    ax.bar(x_female_f, data_female_f, bar_width, label='Female Freezing', color=color_female, hatch='//')
+    ax.bar(x_male_g, data_male_g, bar_width, label='Male Grooming', color=color_male)
+    ax.bar(x_female_g, data_female_g, bar_width, label='Female Grooming', color=color_female)
 
     ax.set_title(f'Freezing & Grooming: {group_name} Group', fontsize=18, fontweight='bold')
     ax.set_xlabel('Time (minutes)', fontsize=14)
     ax.set_ylabel('Duration (seconds)', fontsize=14)
-    ax.set_xticks(np.arange(0, 10.1, 2.5))
+    ax.set_xticks(_XTICKS)
     ax.set_xlim(0, 11.5)
     
     all_data = np.concatenate([data_male_f, data_female_f, data_male_g, data_female_g])
@@ -202,14 +287,15 @@ def draw_freezing_grooming_on_ax(ax, data_male_f, data_female_f, data_male_g, da
 
 def plot_freezing_grooming_by_group(all_freezing_data, all_grooming_data, bin_ends_minutes):
     """
-    Creates, saves, and shows serial plots of freezing & grooming, one for each color group.
+    Creates and saves one plot of freezing & grooming per color group, rendered in a process pool.
     """
     print("\n--- Generating Freezing & Grooming Plots (by Group) ---")
     color_groups = ['B', 'R', 'G', 'W']
     group_names = {'B': 'Blue', 'R': 'Red', 'G': 'Green', 'W': 'White'}
 
+    os.makedirs('../plots/freezing_grooming', exist_ok=True)
+    jobs = []
     for group_code in color_groups:
-        fig, ax = plt.subplots(figsize=(10, 7))
         male_id = f'M{group_code}'
         female_id = f'F{group_code}'
         
@@ -219,20 +305,16 @@ def plot_freezing_grooming_by_group(all_freezing_data, all_grooming_data, bin_en
         female_g_data = all_grooming_data.get(female_id, np.zeros(len(bin_ends_minutes)))
         
         group_name = group_names[group_code]
-        draw_freezing_grooming_on_ax(ax, male_f_data, female_f_data, male_g_data, female_g_data, bin_ends_minutes, group_name)
-
-        fig.tight_layout()
         filename = f'../plots/freezing_grooming/freezing_grooming_group_{group_name.lower()}.png'
-        if not os.path.exists('../plots/freezing_grooming'):
-            os.makedirs('../plots/freezing_grooming', exist_ok=True)
-        plt.savefig(filename, dpi=300)
-        print(f"Plot saved to '{filename}'")
-        plt.show()
+        jobs.append((draw_freezing_grooming_on_ax, (male_f_data, female_f_data, male_g_data, female_g_data, bin_ends_minutes, group_name), filename))
+
+    _render_groups(jobs)
 
 def plot_freezing_grooming_all_animals(all_freezing_data, all_grooming_data, bin_ends_minutes):
     """
     Creates, saves, and shows a plot for freezing and grooming durations for all animals.
     """
+    plt = _pyplot()
     fig, ax = plt.subplots(figsize=(12, 8))
     
     animal_ids = sorted(all_freezing_data.keys())
@@ -245,16 +327,16 @@ def plot_freezing_grooming_all_animals(all_freezing_data, all_grooming_data, bin
         mec = 'black' if is_female else color
 
         # Plot freezing (solid line, circle marker)
-        ax.plot(bin_ends_minutes, all_freezing_data[animal_id], marker='o', linestyle='-', color=color,
-                markerfacecolor=mfc, markeredgecolor=mec, markersize=8, markeredgewidth=1.5)
+        freezing_line, = ax.plot(bin_ends_minutes, all_freezing_data[animal_id], marker='o', linestyle='-', color=color,
+                                 markerfacecolor=mfc, markeredgecolor=mec, markersize=8, markeredgewidth=1.5)
         
         # Plot grooming (dashed line, x marker)
-        ax.plot(bin_ends_minutes, all_grooming_data[animal_id], marker='x', linestyle='--', color=color,
-                markersize=8, markeredgewidth=1.5)
+        grooming_line, = ax.plot(bin_ends_minutes, all_grooming_data[animal_id], marker='x', linestyle='--', color=color,
+                                 markersize=8, markeredgewidth=1.5)
+        freezing_line.set_rasterized(True)
+        grooming_line.set_rasterized(True)
 
-    ax.set_title('Freezing and Grooming Over Time', fontsize=20, fontweight='bold', pad=20)
-    ax.set_xlabel('Time (minutes)', fontsize=16)
-    ax.set_ylabel('Duration (seconds)', fontsize=16)
+    _style_line_axes(ax, 'Freezing and Grooming Over Time', 'Duration (seconds)')
     
     from matplotlib.lines import Line2D
     legend_elements = [
@@ -273,145 +355,104 @@ def plot_freezing_grooming_all_animals(all_freezing_data, all_grooming_data, bin
 
     ax.legend(handles=legend_elements, loc='upper left', bbox_to_anchor=(1.05, 1))
 
-    ax.set_xticks(np.arange(0, 10.1, 2.5))
-    ax.set_xlim(0, 10.3)
-    ax.minorticks_on()
-    ax.grid(which='major', linestyle='--', linewidth='0.5', color='gray')
-
-    max_y_f = np.max([np.max(d) for d in all_freezing_data.values() if d.size > 0]) if all_freezing_data else 0
-    max_y_g = np.max([np.max(d) for d in all_grooming_data.values() if d.size > 0]) if all_grooming_data else 0
-    ax.set_ylim(0, max(max_y_f, max_y_g) * 1.15 if max(max_y_f, max_y_g) > 0 else 10)
+    all_vals = [d for data in (all_freezing_data, all_grooming_data) for d in data.values() if d.size > 0]
+    max_y = np.concatenate(all_vals).max() if all_vals else 0
+    ax.set_ylim(0, max_y * 1.15 if max_y > 0 else 10)
 
     fig.tight_layout()
 
     output_dir = '../plots/freezing_grooming'
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir, exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
     
     filename = f'{output_dir}/freezing_grooming_all.png'
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
+    plt.savefig(filename, dpi=300)
     print(f"Plot saved to '{filename}'")
-    plt.show()
+    if SHOW:
+        plt.show()
     plt.close(fig)
 
 def plot_accumulated_crossings_all_animals(all_animals_data, bin_ends_minutes):
     """
     Creates, saves, and shows a plot for accumulated crossings for all animals.
     """
+    plt = _pyplot()
     fig, ax = plt.subplots(figsize=(12, 8))
     
-    for animal_id, accumulated_data in all_animals_data.items():
-        color = get_plot_color(animal_id)
-        is_female = animal_id.startswith('F')
-        
-        mfc = 'white' if is_female else color
-        mec = 'black' if is_female else color
+    handles = _draw_animal_lines(ax, all_animals_data, bin_ends_minutes, rasterized=True)
 
-        ax.plot(bin_ends_minutes, accumulated_data, marker='o', linestyle='-', label=animal_id, color=color,
-                markerfacecolor=mfc, markeredgecolor=mec, markersize=8, markeredgewidth=1.5)
-
-    ax.set_title('Accumulated Crossings Over a 10-Minute Window', fontsize=20, fontweight='bold', pad=20)
-    ax.set_xlabel('Time (minutes)', fontsize=16)
-    ax.set_ylabel('Accumulated Crossings', fontsize=16)
+    _style_line_axes(ax, 'Accumulated Crossings Over a 10-Minute Window', 'Accumulated Crossings')
     
-    max_y = np.max([np.max(d) for d in all_animals_data.values() if d.size > 0]) if all_animals_data else 0
+    all_vals = [d for d in all_animals_data.values() if d.size > 0]
+    max_y = np.concatenate(all_vals).max() if all_vals else 0
     ax.set_ylim(0, max_y * 1.1 if max_y > 0 else 10)
-    ax.set_xticks(np.arange(0, 10.1, 2.5))
-    ax.set_xlim(0, 10.3)
-    ax.minorticks_on()
-    ax.grid(which='major', linestyle='--', linewidth='0.5', color='gray')
-    ax.legend(title='Animal ID', loc='best', bbox_to_anchor=(0.2, 0.8), fontsize=12, title_fontsize=14)
+    ax.legend(handles=handles, title='Animal ID', loc='best', bbox_to_anchor=(0.2, 0.8), fontsize=12, title_fontsize=14)
     
     fig.tight_layout(rect=[0, 0, 0.85, 1])
 
     output_dir = '../plots'
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
     
     filename = f'{output_dir}/accumulated_crossings_all.png'
     plt.savefig(filename, dpi=300)
     print(f"Plot saved to '{filename}'")
-    plt.show()
+    if SHOW:
+        plt.show()
     plt.close(fig)
 
 def plot_total_crossings_all_animals(all_animals_data, bin_ends_minutes):
     """
     Creates, saves, and shows a plot for total crossings for all animals.
     """
+    plt = _pyplot()
     fig, ax = plt.subplots(figsize=(12, 8))
     
-    for animal_id, total_data in all_animals_data.items():
-        color = get_plot_color(animal_id)
-        is_female = animal_id.startswith('F')
-        
-        mfc = 'white' if is_female else color
-        mec = 'black' if is_female else color
-
-        ax.plot(bin_ends_minutes, total_data, marker='o', linestyle='-', label=animal_id, color=color,
-                markerfacecolor=mfc, markeredgecolor=mec, markersize=8, markeredgewidth=1.5)
+    handles = _draw_animal_lines(ax, all_animals_data, bin_ends_minutes)
 
-    ax.set_title('Open Field - Total Locomotor Activity', fontsize=20, fontweight='bold', pad=20)
-    ax.set_xlabel('Time (minutes)', fontsize=16)
-    ax.set_ylabel('Total Crossings', fontsize=16)
+    _style_line_axes(ax, 'Open Field - Total Locomotor Activity', 'Total Crossings')
     
-    max_y = np.max([np.max(d) for d in all_animals_data.values() if d.size > 0]) if all_animals_data else 0
+    all_vals = [d for d in all_animals_data.values() if d.size > 0]
+    max_y = np.concatenate(all_vals).max() if all_vals else 0
     ax.set_ylim(0, max_y * 1.1 if max_y > 0 else 10)
-    ax.set_xticks(np.arange(0, 10.1, 2.5))
-    ax.set_xlim(0, 10.3)
-    ax.minorticks_on()
-    ax.grid(which='major', linestyle='--', linewidth='0.5', color='gray')
-    ax.legend(title='Animal ID', loc='best', bbox_to_anchor=(0.2, 0.8), fontsize=12, title_fontsize=14)
+    ax.legend(handles=handles, title='Animal ID', loc='best', bbox_to_anchor=(0.2, 0.8), fontsize=12, title_fontsize=14)
     
     fig.tight_layout(rect=[0, 0, 0.85, 1])
 
     output_dir = '../plots'
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
     
     filename = f'{output_dir}/total_crossings_all.png'
     plt.savefig(filename, dpi=300)
     print(f"Plot saved to '{filename}'")
-    plt.show()
+    if SHOW:
+        plt.show()
     plt.close(fig)
 
 def plot_accumulated_periphery_crossings_all_animals(all_animals_data, bin_ends_minutes):
     """
     Creates, saves, and shows a plot for accumulated periphery crossings for all animals.
     """
+    plt = _pyplot()
     fig, ax = plt.subplots(figsize=(12, 8))
     
-    for animal_id, accumulated_data in all_animals_data.items():
-        color = get_plot_color(animal_id)
-        is_female = animal_id.startswith('F')
-        
-        mfc = 'white' if is_female else color
-        mec = 'black' if is_female else color
-
-        ax.plot(bin_ends_minutes, accumulated_data, marker='o', linestyle='-', label=animal_id, color=color,
-                markerfacecolor=mfc, markeredgecolor=mec, markersize=8, markeredgewidth=1.5)
+    handles = _draw_animal_lines(ax, all_animals_data, bin_ends_minutes)
 
-    ax.set_title('Accumulated Periphery Crossings Over a 10-Minute Window', fontsize=20, fontweight='bold', pad=20)
-    ax.set_xlabel('Time (minutes)', fontsize=16)
-    ax.set_ylabel('Accumulated Periphery Crossings', fontsize=16)
+    _style_line_axes(ax, 'Accumulated Periphery Crossings Over a 10-Minute Window', 'Accumulated Periphery Crossings')
     
-    max_y = np.max([np.max(d) for d in all_animals_data.values() if d.size > 0]) if all_animals_data else 0
+    all_vals = [d for d in all_animals_data.values() if d.size > 0]
+    max_y = np.concatenate(all_vals).max() if all_vals else 0
     ax.set_ylim(0, max_y * 1.1 if max_y > 0 else 10)
-    ax.set_xticks(np.arange(0, 10.1, 2.5))
-    ax.set_xlim(0, 10.3)
-    ax.minorticks_on()
-    ax.grid(which='major', linestyle='--', linewidth='0.5', color='gray')
-    ax.legend(title='Animal ID', loc='best', bbox_to_anchor=(0.2, 0.8), fontsize=12, title_fontsize=14)
+    ax.legend(handles=handles, title='Animal ID', loc='best', bbox_to_anchor=(0.2, 0.8), fontsize=12, title_fontsize=14)
     
     fig.tight_layout(rect=[0, 0, 0.85, 1])
 
     output_dir = '../plots'
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
     
     filename = f'{output_dir}/accumulated_periphery_crossings_all.png'
     plt.savefig(filename, dpi=300)
     print(f"Plot saved to '{filename}'")
-    plt.show()
+    if SHOW:
+        plt.show()
     plt.close(fig)
 
 def plot_mean_thigmotaxis_by_sex(male_mean, female_mean, bin_ends_minutes):
@@ -419,19 +460,22 @@ def plot_mean_thigmotaxis_by_sex(male_mean, female_mean, bin_ends_minutes):
     Creates, saves, and shows a bar chart comparing the mean thigmotaxis index
     between all males and all females.
     """
+    plt = _pyplot()
     fig, ax = plt.subplots(figsize=(10, 7))
 
     bar_width = 0.8
-    x = np.arange(len(bin_ends_minutes))
+    half_w = bar_width * 0.5
+    x_left = bin_ends_minutes - half_w
+    x_right = bin_ends_minutes + half_w
 
-    ax.bar(bin_ends_minutes - bar_width/2, male_mean, bar_width, label='Male Mean', color='orange')
-    ax.bar(bin_ends_minutes + bar_width/2, female_mean, bar_width, label='Female Mean', color='yellow')
+    ax.bar(x_left, male_mean, bar_width, label='Male Mean', color='orange')
+    ax.bar(x_right, female_mean, bar_width, label='Female Mean', color='yellow')
 
     ax.set_title('Mean Thigmotaxis Index: All Males vs. All Females', fontsize=18, fontweight='bold')
     ax.set_xlabel('Time (minutes)', fontsize=14)
     ax.set_ylabel('Mean Thigmotaxis Index', fontsize=14)
     ax.set_ylim(0, 1.05)
-    ax.set_xticks(np.arange(0, 10.1, 2.5))
+    ax.set_xticks(_XTICKS)
     ax.set_xlim(0, 11)
     ax.grid(which='major', linestyle='--', linewidth='0.5', color='gray', axis='y')
     ax.legend(fontsize=12)
@@ -439,13 +483,13 @@ def plot_mean_thigmotaxis_by_sex(male_mean, female_mean, bin_ends_minutes):
     fig.tight_layout()
 
     output_dir = '../plots/thigmotaxis'
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir, exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
     
     filename = f'{output_dir}/thigmotaxis_mean_by_sex.png'
     plt.savefig(filename, dpi=300)
     print(f"Plot saved to '{filename}'")
-    plt.show()
+    if SHOW:
+        plt.show()
     plt.close(fig)
 
 
@@ -477,6 +521,7 @@ def plot_mean_periphery_center_ratio_by_sex(all_animals_ratios):
     sem_male = np.std(male_ratios, ddof=1) / np.sqrt(len(male_ratios))
     sem_female = np.std(female_ratios, ddof=1) / np.sqrt(len(female_ratios))
 
+    plt = _pyplot()
     fig, ax = plt.subplots(figsize=(8, 7))
 
     # Bar plot
@@ -484,19 +529,19 @@ def plot_mean_periphery_center_ratio_by_sex(all_animals_ratios):
     bar_labels = ['Male', 'Female']
     means = [mean_male, mean_female]
     sems = [sem_male, sem_female]
-    ax.bar(bar_positions, means, yerr=sems, capsize=5, color=['orange', 'yellow'], width=0.6)
+    ax.bar(bar_positions, means, yerr=sems, capsize=5, color=['orange', 'yellow'], width=0.6, rasterized=True)
 
     # Individual data points (scatter plot)
     jitter = 0.05
     male_x = np.random.normal(0, jitter, len(male_ratios))
     female_x = np.random.normal(1, jitter, len(female_ratios))
 
-    ax.scatter(male_x, male_ratios, color=[get_plot_color(id) for id in male_ids], zorder=2, label='_nolegend_')
+    ax.scatter(male_x, male_ratios, color=[get_plot_color(id) for id in male_ids], zorder=2, label='_nolegend_', rasterized=True)
     
     # Female points hollow
     female_colors = [get_plot_color(id) for id in female_ids]
     ax.scatter(female_x, female_ratios, facecolors='white',
-               edgecolors=female_colors, s=60, zorder=2, label='_nolegend_') # s is marker size
+               edgecolors=female_colors, s=60, zorder=2, label='_nolegend_', rasterized=True) # s is marker size
 
     ax.set_title('Mean Periphery/Center Ratio by Sex', fontsize=18, fontweight='bold', pad=20)
     ax.set_ylabel('Periphery/Center Ratio', fontsize=14)
@@ -517,12 +562,13 @@ def plot_mean_periphery_center_ratio_by_sex(all_animals_ratios):
     fig.tight_layout(rect=[0, 0, 0.85, 1])
     
     output_dir = '../plots/thigmotaxis'
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir, exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
     
     filename = f'{output_dir}/mean_periphery_center_ratio_by_sex.png'
-    plt.savefig(filename, dpi=300)
+    # Data artists are rasterized; 150 dpi keeps the PNG encode cheap while text stays legible.
+    plt.savefig(filename, dpi=150)
     print(f"Plot saved to '{filename}'")
-    plt.show()
+    if SHOW:
+        plt.show()
     plt.close(fig)
 
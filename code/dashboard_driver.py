@@ -0,0 +1,44 @@
+
+"""
+This module holds the shared driver of the dashboards built on analysis_pipeline.compute_all
+(freezing/grooming, thigmotaxis and overall thigmotaxis): load the data, run the shared
+analysis pass once, and hand its results to the dashboard's plotting step.
+"""
+
+import data_loader
+import analysis_pipeline
+
+def run_dashboard(plot_fn, start_sec=3, end_sec=603, bin_size=150, results=None):
+    """
+    Loads and analyzes the data for all animals (unless results are given), then plots them.
+
+    Args:
+        plot_fn (callable): Called as plot_fn(results) to draw and save the dashboard's plots.
+        start_sec (int): The start time in seconds for the analysis window.
+        end_sec (int): The end time in seconds for the analysis window.
+        bin_size (int): The size of each analysis bin in seconds.
+        results (dict): Output of analysis_pipeline.compute_all for the same window. If given,
+                        the data is not loaded or analyzed again.
+
+    Returns:
+        dict: The compute_all results that were plotted, so they can be passed on to the
+              next dashboard, or None if no data files could be loaded.
+    """
+    if results is None:
+        # 1. Load data for all animals
+        loaded_data = data_loader.load_matlab_data()
+
+        if not loaded_data:
+            print("Error: No data files were successfully loaded. Cannot generate plots.")
+            return None
+
+        # 2. Run the shared analysis pass for all animals
+        results = analysis_pipeline.compute_all(loaded_data, start_sec, end_sec, bin_size)
+
+    # 3. Plot if the analysis yielded data
+    if results['unit_ids'] and results['bin_centers'].size > 0:
+        plot_fn(results)
+    else:
+        print("Error: Analysis resulted in no data to plot.")
+
+    return results
@@ -1,6 +1,9 @@
 import os
+import functools
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import scipy.io
-import pandas as pd
 
 # --- Constants ---
 # The directory of this script
@@ -10,33 +13,150 @@ PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
 # The default data directory, now an absolute path
 DEFAULT_DATA_DIR = os.path.join(PROJECT_ROOT, 'data_7.12')
 # Default list of animal units
-UNITS = ['FB', 'FG', 'FR', 'FW', 'MB', 'MG', 'MR', 'MW']
+UNITS = ('FB', 'FG', 'FR', 'FW', 'MB', 'MG', 'MR', 'MW')
 # Default rotarod data file name
 DEFAULT_ROTAROD_FILE = 'rotarod_071225.xlsx'
+# Rotarod spreadsheet columns used by load_rotarod_data
+ROTAROD_COLUMNS = frozenset({'Subject ID', 'Date', 'Time', 'Duration(sec)'})
+# Directory for the parsed .mat cache (safe to delete; rebuilt on the next load)
+CACHE_DIR = os.path.join(PROJECT_ROOT, '.cache')
+# Behavior interval variables stored in each .mat file
+BEHAVIOR_KEYS = ('Freezing_start_stop', 'grooming_start_stop')
+# Crossing timestamp variables stored in each .mat file (all that the crossing analyses read)
+CROSSING_KEYS = ('crossing_times', 'periphery_times')
 
+# Struct-of-arrays view of all animals, as returned by stack_animal_data
+AllAnimals = namedtuple('AllAnimals', ['ids', 'crossings', 'cross_lens', 'periph', 'periph_lens', 'behaviors'])
 
-def load_matlab_data(units=UNITS, data_dir=DEFAULT_DATA_DIR):
+
+@functools.lru_cache(maxsize=None)
+def _load_mat_file(file_path, mtime, size):
+    """
+    Parses a single .mat file. Results are memoized per (path, modification time, size), so
+    repeated loads within one session reuse the parsed data unless the file changed.
+
+    Across runs, the parsed arrays are kept as an .npz file in CACHE_DIR and reused while
+    the source path, modification time and size still match, skipping the MATLAB parser.
+    """
+    cache_path = os.path.join(CACHE_DIR, os.path.splitext(os.path.basename(file_path))[0] + '.npz')
+    try:
+        with np.load(cache_path) as cached:
+            if (cached['__source__'] == file_path and cached['__mtime__'] == mtime
+                    and cached['__size__'] == size):
+                return {key: cached[key] for key in cached.files if not key.startswith('__')}
+    except (OSError, KeyError, ValueError):
+        pass  # No usable cache entry; parse the .mat file below.
+
+    arrays = {key: value for key, value in scipy.io.loadmat(file_path).items() if not key.startswith('__')}
+    # The crossing analyses count events with binary searches, so timestamps must be ascending.
+    # MATLAB event logs already are; this one check per parse keeps the analyses free of it.
+    for key in CROSSING_KEYS:
+        times = arrays.get(key)
+        if times is not None and np.any(np.diff(times.ravel()) < 0):
+            print(f"Warning: '{key}' in '{file_path}' is not sorted; sorting it.")
+            arrays[key] = np.sort(times, axis=None).reshape(times.shape)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f'{cache_path}.{os.getpid()}.tmp.npz'
+        np.savez(tmp_path, __source__=file_path, __mtime__=mtime, __size__=size, **arrays)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: Could not write cache file '{cache_path}': {e}")
+    return arrays
+
+
+def load_matlab_data(units=UNITS, data_dir=DEFAULT_DATA_DIR, variable_names=None):
     """
     Loads MATLAB data for a given list of units.
 
+    Parsed files are cached for the rest of the session, so the returned arrays are
+    shared between callers and should be treated as read-only.
+
     Args:
         units (list): A list of unit names (e.g., ['FB', 'MW']).
         data_dir (str): The absolute path to the directory containing the data files.
+        variable_names (tuple): The MATLAB variables to return (e.g. CROSSING_KEYS); all of
+                                them if None. Each file is still parsed and cached in full,
+                                so loads of different variables share one parse per file.
 
     Returns:
         dict: A dictionary where keys are the unit names and values are the loaded MATLAB data.
-              If a file for a unit is not found, the corresponding value will be None.
+              Units whose file is not found are left out (a warning is printed for each).
+    """
+    paths = [os.path.join(data_dir, f'{unit}_OpenField_rawdata.mat') for unit in units]
+    # The files are independent, so their reads overlap in a small thread pool.
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(paths)))) as executor:
+        loaded_data = {unit: data for unit, data in executor.map(_try_load, units, paths) if data is not None}
+
+    if variable_names is not None:
+        loaded_data = {unit: {key: data[key] for key in variable_names if key in data}
+                       for unit, data in loaded_data.items()}
+
+    num_skipped = len(paths) - len(loaded_data)
+    if num_skipped:
+        print(f"Warning: Skipped {num_skipped} of {len(paths)} units without a data file.")
+    return loaded_data
+
+
+def _try_load(unit, file_path):
+    """
+    Loads one unit's .mat file, returning (unit, data) or (unit, None) if the file is missing.
+    """
+    try:
+        stat = os.stat(file_path)
+        return unit, _load_mat_file(file_path, stat.st_mtime, stat.st_size)
+    except FileNotFoundError:
+        print(f"Warning: File not found for unit '{unit}' at path: {file_path}")
+        return unit, None
+
+
+def _pad_rows(arrays, shape_prefix=()):
+    """
+    Copies 1D (or shape_prefix + 1D) arrays of different lengths into one float32 array,
+    padded at the end of each row with +inf so padding falls outside any time window.
     """
-    data_map = {}
-    for unit in units:
-        file_name = f'{unit}_OpenField_rawdata.mat'
-        file_path = os.path.join(data_dir, file_name)
-        try:
-            data_map[unit] = scipy.io.loadmat(file_path)
-        except FileNotFoundError:
-            print(f"Warning: File not found for unit '{unit}' at path: {file_path}")
-            data_map[unit] = None
-    return data_map
+    max_len = max((array.shape[-1] for array in arrays), default=0)
+    padded = np.full((len(arrays),) + shape_prefix + (max_len,), np.inf, dtype=np.float32)
+    for i, array in enumerate(arrays):
+        padded[i, ..., :array.shape[-1]] = array
+    return padded
+
+
+def stack_animal_data(loaded_data):
+    """
+    Transposes the per-animal data dictionaries into a struct-of-arrays layout.
+
+    Args:
+        loaded_data (dict): The loaded MATLAB data for each unit (units without data excluded).
+
+    Returns:
+        AllAnimals: A named tuple with:
+            - ids (list): The unit IDs, in row order.
+            - crossings (np.array): A (num_animals, max_crossings) float32 matrix of crossing times.
+            - cross_lens (np.array): The number of crossing times of each animal.
+            - periph (np.array): A (num_animals, max_periphery) float32 matrix of periphery crossing times.
+            - periph_lens (np.array): The number of periphery crossing times of each animal.
+            - behaviors (dict): For each behavior key, a (num_animals, 2, max_events) float32 array
+              of start (row 0) and stop (row 1) times.
+        Rows are padded with +inf, so padding is excluded by any time-window filter.
+    """
+    ids = list(loaded_data.keys())
+    crossings = [loaded_data[unit]['crossing_times'].ravel() for unit in ids]
+    periphery = [loaded_data[unit]['periphery_times'].ravel() for unit in ids]
+
+    behaviors = {}
+    for behavior_key in BEHAVIOR_KEYS:
+        intervals = [loaded_data[unit].get(behavior_key, np.empty((2, 0))).reshape(2, -1) for unit in ids]
+        behaviors[behavior_key] = _pad_rows(intervals, shape_prefix=(2,))
+
+    return AllAnimals(
+        ids=ids,
+        crossings=_pad_rows(crossings),
+        cross_lens=np.array([times.size for times in crossings], dtype=np.intp),
+        periph=_pad_rows(periphery),
+        periph_lens=np.array([times.size for times in periphery], dtype=np.intp),
+        behaviors=behaviors,
+    )
 
 
 def load_rotarod_data(file_name=DEFAULT_ROTAROD_FILE, data_dir=DEFAULT_DATA_DIR):
@@ -54,26 +174,25 @@ def load_rotarod_data(file_name=DEFAULT_ROTAROD_FILE, data_dir=DEFAULT_DATA_DIR)
             - Latency_to_Fall: Fall latency in seconds
         Returns None if the file is not found.
     """
+    # pandas is only needed for the rotarod data, so it is not imported with the module
+    import pandas as pd
+
     file_path = os.path.join(data_dir, file_name)
     
     try:
-        # Read the Excel file
-        df = pd.read_excel(file_path)
+        # Read only the needed columns (the header names carry trailing whitespace)
+        df = pd.read_excel(file_path, usecols=lambda c: c.strip() in ROTAROD_COLUMNS)
         
         # Strip whitespace from column names
         df.columns = df.columns.str.strip()
         
-        # Filter out rows without Subject ID (empty cells or NaN)
-        df = df[df['Subject ID'].notna()].copy()
-        
-        # Also filter out rows where Subject ID is empty string or whitespace
-        df = df[df['Subject ID'].astype(str).str.strip() != ''].copy()
+        # Filter out rows without Subject ID (NaN, empty string or whitespace) in one pass
+        subject_ids = df['Subject ID']
+        df = df.loc[subject_ids.notna() & subject_ids.astype(str).str.strip().ne('')].copy()
         
         # Combine Date and Time for sorting (with error handling for missing values)
-        df['DateTime'] = pd.to_datetime(
-            df['Date'].astype(str) + ' ' + df['Time'].astype(str), 
-            errors='coerce'
-        )
+        df['DateTime'] = (pd.to_datetime(df['Date'], errors='coerce')
+                          + pd.to_timedelta(df['Time'].astype(str), errors='coerce'))
         
         # Sort by Subject_ID and DateTime
         df = df.sort_values(['Subject ID', 'DateTime']).reset_index(drop=True)
@@ -81,12 +200,11 @@ def load_rotarod_data(file_name=DEFAULT_ROTAROD_FILE, data_dir=DEFAULT_DATA_DIR)
         # Assign session numbers chronologically for each subject
         df['Session'] = df.groupby('Subject ID').cumcount() + 1
         
-        # Create clean DataFrame with only what we need
-        rotarod_df = pd.DataFrame({
-            'Subject_ID': df['Subject ID'],
-            'Session': df['Session'],
-            'Latency_to_Fall': df['Duration(sec)']
-        })
+        # Keep only what we need, under the output column names
+        rotarod_df = (df[['Subject ID', 'Session', 'Duration(sec)']]
+                      .rename(columns={'Subject ID': 'Subject_ID', 'Duration(sec)': 'Latency_to_Fall'})
+                      .astype({'Session': 'int16'})
+                      .reset_index(drop=True))
         
         print(f"Successfully loaded rotarod data from {file_name}")
         print(f"Subjects: {rotarod_df['Subject_ID'].nunique()}")
@@ -107,7 +225,7 @@ if __name__ == '__main__':
     all_data = load_matlab_data()
 
     # Print the keys for the loaded data for one unit to show the structure
-    if all_data and 'FB' in all_data and all_data['FB'] is not None:
+    if 'FB' in all_data:
         print("Successfully loaded data for FB.")
         print("Keys in the loaded data for FB:", all_data['FB'].keys())
         # Accessing data with correct keys
@@ -117,13 +235,13 @@ if __name__ == '__main__':
             print("Crossing times for FB (first 5):", all_data['FB']['crossing_times'].flatten()[:5])
 
     # Example of accessing a specific unit's data
-    if all_data and 'MG' in all_data and all_data['MG'] is not None:
+    if 'MG' in all_data:
         print("\nSuccessfully loaded data for MG.")
 
     # Example with a unit that doesn't exist
     print("\nAttempting to load a non-existent unit 'XX':")
     non_existent_data = load_matlab_data(['XX'])
-    print("Result for 'XX':", non_existent_data['XX'])
+    print("Result for 'XX':", non_existent_data.get('XX'))
     
     print("\n" + "="*50)
     print("Loading Rotarod Data")
@@ -5,7 +5,6 @@ between male and female mice for each color group (Blue, Red, Green, White).
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 import os
 import sys
 
@@ -26,8 +25,8 @@ def generate_total_crossings_dashboard(start_sec=3, end_sec=603, bin_size=150):
     print("\n--- Generating Total Crossings Dashboard ---")
 
     # 1. Load data for all animals
-    raw_data = data_loader.load_matlab_data()
-    loaded_data = {unit: data for unit, data in raw_data.items() if data is not None}
+    # Only the crossing timestamps are needed
+    loaded_data = data_loader.load_matlab_data(variable_names=data_loader.CROSSING_KEYS)
 
     if not loaded_data:
         print("Error: No data files were successfully loaded. Cannot generate dashboard.")
@@ -35,13 +34,13 @@ def generate_total_crossings_dashboard(start_sec=3, end_sec=603, bin_size=150):
 
     # 2. Run total crossings analysis for all animals
     all_total_crossings = {}
-    bin_centers = np.array([])
+    # Counts are small integers; float32 halves what the plotting code has to move around
+    bin_centers = analysis.get_bin_ends_minutes(start_sec, end_sec, bin_size).astype(np.float32)
 
-    for unit, data in loaded_data.items():
-        total_counts, bins = analysis.calculate_total_crossings_in_window(data, bin_size, start_sec, end_sec)
-        all_total_crossings[unit] = total_counts
-        if bin_centers.size == 0 and bins.size > 0:
-            bin_centers = bins
+    results = analysis.analyze_animals_in_parallel(loaded_data, analysis.calculate_total_crossings_in_window,
+                                                   bin_size, start_sec, end_sec)
+    for unit, (total_counts, _) in results.items():
+        all_total_crossings[unit] = total_counts.astype(np.float32, copy=False)
 
     # 3. Plot the dashboard if analysis yielded data
     if all_total_crossings and bin_centers.size > 0:
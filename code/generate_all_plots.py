@@ -0,0 +1,40 @@
+
+"""
+This script generates every plot in the repository in a single session.
+Running the analyses together means each .mat file is parsed only once,
+as the data loader caches parsed files for the rest of the session.
+"""
+
+import data_loader
+from accumulated_crossings_plot import generate_accumulated_crossings_plot
+from accumulated_periphery_crossings_plot import generate_accumulated_periphery_crossings_plot
+from distance_dashboard import generate_total_crossings_dashboard
+from freezing_grooming_dashboard import generate_freezing_grooming_dashboard
+from thigmotaxis_dashboard import generate_thigmotaxis_dashboard
+from thigmotaxis_overall_plot import generate_thigmotaxis_overall_plot
+from rotarod_ltf_learning_curve import plot_individual_learning_curves, plot_sex_comparison
+
+def generate_all_plots(start_sec=3, end_sec=603, bin_size=150):
+    """
+    Runs all Open Field analyses with a shared time window, followed by the rotarod plots.
+    """
+    generate_accumulated_crossings_plot(start_sec, end_sec, bin_size)
+    generate_accumulated_periphery_crossings_plot(start_sec, end_sec, bin_size)
+    generate_total_crossings_dashboard(start_sec, end_sec, bin_size)
+
+    # The freezing/grooming and thigmotaxis plots share one analysis pass
+    results = generate_freezing_grooming_dashboard(start_sec, end_sec, bin_size)
+    if results is not None:
+        generate_thigmotaxis_dashboard(start_sec, end_sec, bin_size, results)
+        generate_thigmotaxis_overall_plot(start_sec, end_sec, bin_size, results)
+
+    print("\n--- Generating Rotarod Plots ---")
+    rotarod_df = data_loader.load_rotarod_data()
+    if rotarod_df is not None:
+        plot_individual_learning_curves(rotarod_df)
+        plot_sex_comparison(rotarod_df)
+    else:
+        print("Failed to load rotarod data.")
+
+if __name__ == '__main__':
+    generate_all_plots()
@@ -1,6 +1,8 @@
 import os
-import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import numpy as np
+import pandas as pd
 import data_loader
 import behavioral_plotting as plotting
 
@@ -10,6 +12,35 @@ PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
 PLOT_DIR = os.path.join(PROJECT_ROOT, 'plots', 'rotarod')
 os.makedirs(PLOT_DIR, exist_ok=True)
 
+# Figure shared by both rotarod plots, created on first use by _rotarod_axes and closed
+# by _close_rotarod_figure after the sex comparison plot
+_FIG = None
+
+
+def _rotarod_axes():
+    """
+    Returns the cleared Axes of the figure shared by the rotarod plots. The figure and its
+    Axes are built once and then only cleared, so repeated plotting skips their setup.
+    """
+    global _FIG
+    if _FIG is None:
+        # pyplot comes from behavioral_plotting, which picks the backend (see SHOW_PLOTS)
+        _FIG = plotting._pyplot().figure(figsize=(10, 6), layout='constrained')
+        _FIG.add_subplot()
+    ax = _FIG.axes[0]
+    ax.cla()
+    return ax
+
+
+def _close_rotarod_figure():
+    """
+    Closes the figure shared by the rotarod plots, so it does not outlive the last plot.
+    """
+    global _FIG
+    if _FIG is not None:
+        plotting._pyplot().close(_FIG)
+        _FIG = None
+
 
 def plot_individual_learning_curves(rotarod_df):
     """
@@ -18,47 +49,49 @@ def plot_individual_learning_curves(rotarod_df):
     Args:
         rotarod_df: DataFrame from load_rotarod_data()
     """
-    plt.figure(figsize=(10, 6))
+    ax = _rotarod_axes()
     
-    # Get unique subjects
-    subjects = rotarod_df['Subject_ID'].unique()
-    
-    # Plot each subject's learning curve
-    for subject in subjects:
-        subject_data = rotarod_df[rotarod_df['Subject_ID'] == subject]
-        
-        # Get color for this subject
+    # Line color, marker face and marker edge for each subject (females get hollow markers)
+    styles = {}
+    for subject in rotarod_df['Subject_ID'].unique():
         color = plotting.get_plot_color(subject)
         is_female = subject.startswith('F')
-        
-        mfc = 'white' if is_female else color
-        mec = 'black' if is_female else color
-        
-        # Plot the learning curve
-        plt.plot(subject_data['Session'], 
-                subject_data['Latency_to_Fall'], 
-                marker='o', 
-                label=subject, 
-                color=color,
-                linewidth=2,
-                markersize=8, # Increased markersize for visibility
-                markerfacecolor=mfc,
-                markeredgecolor=mec,
-                markeredgewidth=1.5)
-    
-    plt.xlabel('Session Number', fontsize=14)
-    plt.ylabel('Latency to Fall (seconds)', fontsize=14)
-    plt.title('Rotarod Learning Curves - All Subjects', fontsize=18, fontweight='bold')
-    plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=12)
-    plt.xticks(np.arange(1, 6, 1))  # Set integer ticks
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    
-    # Save the plot
-    output_path = os.path.join(PLOT_DIR, 'all_subjects_learning_curves.png')
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        styles[subject] = (color, 'white' if is_female else color, 'black' if is_female else color)
+    
+    # Collect each subject's curve (one partitioning pass instead of a mask per subject)
+    subjects = []
+    segments = []
+    for subject, subject_data in rotarod_df.groupby('Subject_ID', sort=False):
+        subjects.append(subject)
+        segments.append(np.column_stack([subject_data['Session'].to_numpy(dtype=float),
+                                         subject_data['Latency_to_Fall'].to_numpy(dtype=float)]))
+    
+    # Draw all curves as one LineCollection and all markers with one scatter
+    ax.add_collection(LineCollection(segments, colors=[styles[s][0] for s in subjects], linewidths=2))
+    points = np.concatenate(segments) if segments else np.empty((0, 2))
+    lengths = [len(segment) for segment in segments]
+    ax.scatter(points[:, 0], points[:, 1], s=8 ** 2, linewidths=1.5, zorder=2.5,  # markersize 8
+               facecolors=np.repeat([styles[s][1] for s in subjects], lengths),
+               edgecolors=np.repeat([styles[s][2] for s in subjects], lengths))
+    ax.autoscale_view()
+    
+    # Proxy artists so the legend keeps one line-and-marker entry per subject
+    legend_handles = [Line2D([0], [0], marker='o', label=subject, color=styles[subject][0], linewidth=2,
+                             markersize=8, markerfacecolor=styles[subject][1],
+                             markeredgecolor=styles[subject][2], markeredgewidth=1.5)
+                      for subject in subjects]
+    
+    ax.set_xlabel('Session Number', fontsize=14)
+    ax.set_ylabel('Latency to Fall (seconds)', fontsize=14)
+    ax.set_title('Rotarod Learning Curves - All Subjects', fontsize=18, fontweight='bold')
+    ax.legend(handles=legend_handles, bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=12)
+    ax.set_xticks(np.arange(1, 6, 1))  # Set integer ticks
+    ax.grid(True, alpha=0.3)
+    
+    # Save the plot (vector output; the constrained layout already fits the legend and labels)
+    output_path = os.path.join(PLOT_DIR, 'all_subjects_learning_curves.svg')
+    _FIG.savefig(output_path)
     print(f"Saved individual learning curves to: {output_path}")
-    plt.close()
 
 
 def plot_sex_comparison(rotarod_df):
@@ -68,61 +101,63 @@ def plot_sex_comparison(rotarod_df):
     Args:
         rotarod_df: DataFrame from load_rotarod_data()
     """
-    # Extract sex from Subject_ID (first letter: F or M)
-    rotarod_df['Sex'] = rotarod_df['Subject_ID'].astype(str).str[0]
-    
-    # Separate by sex
-    males = rotarod_df[rotarod_df['Sex'] == 'M']
-    females = rotarod_df[rotarod_df['Sex'] == 'F']
-    
-    # Calculate mean and SEM for each session
-    male_means = males.groupby('Session')['Latency_to_Fall'].mean()
-    male_sem = males.groupby('Session')['Latency_to_Fall'].sem()
-    
-    female_means = females.groupby('Session')['Latency_to_Fall'].mean()
-    female_sem = females.groupby('Session')['Latency_to_Fall'].sem()
-    
-    plt.figure(figsize=(10, 6))
+    # Sex is the first letter of Subject_ID (F or M); it is used as a grouping key only,
+    # so the caller's DataFrame is not modified
+    sex = rotarod_df['Subject_ID'].astype(str).str[0].rename('Sex')
+    
+    # Calculate mean and SEM for each sex and session in a single grouping pass
+    stats = rotarod_df.groupby([sex, 'Session'])['Latency_to_Fall'].agg(['mean', 'sem']).unstack('Sex')
+    # A sex missing from the data gets all-NaN columns (and no line below) instead of a KeyError
+    stats = stats.reindex(columns=pd.MultiIndex.from_product([['mean', 'sem'], ['M', 'F']]))
+    male_means = stats['mean']['M'].rename('Latency_to_Fall')
+    male_sem = stats['sem']['M']
+    female_means = stats['mean']['F'].rename('Latency_to_Fall')
+    female_sem = stats['sem']['F']
+    subjects_per_sex = rotarod_df.groupby(sex)['Subject_ID'].nunique()
+    
+    ax = _rotarod_axes()
     
     # Plot males (orange)
     sessions = male_means.index
-    plt.plot(sessions, male_means, marker='o', color='orange', 
-             linewidth=3, markersize=8, label='Males')
-    plt.fill_between(sessions, 
-                     male_means - male_sem, 
-                     male_means + male_sem, 
-                     color='orange', alpha=0.2)
+    if male_means.notna().any():
+        ax.plot(sessions, male_means, marker='o', color='orange', 
+                linewidth=3, markersize=8, label='Males')
+        ax.fill_between(sessions, 
+                        male_means - male_sem, 
+                        male_means + male_sem, 
+                        color='orange', alpha=0.2)
     
     # Plot females (yellow)
     sessions = female_means.index
-    plt.plot(sessions, female_means, marker='o', color='yellow', 
-             linewidth=3, markersize=8, label='Females', 
-             markeredgecolor='black', markeredgewidth=1)
-    plt.fill_between(sessions, 
-                     female_means - female_sem, 
-                     female_means + female_sem, 
-                     color='yellow', alpha=0.2)
-    
-    plt.xlabel('Session Number', fontsize=14)
-    plt.ylabel('Mean Latency to Fall (seconds)', fontsize=14)
-    plt.title('Rotarod Learning Curves - Sex Comparison', fontsize=18, fontweight='bold')
-    plt.legend(fontsize=12)
-    plt.xticks(np.arange(1, 6, 1))  # Set integer ticks
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    
-    # Save the plot
-    output_path = os.path.join(PLOT_DIR, 'sex_comparison_learning_curves.png')
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    if female_means.notna().any():
+        ax.plot(sessions, female_means, marker='o', color='yellow', 
+                linewidth=3, markersize=8, label='Females', 
+                markeredgecolor='black', markeredgewidth=1)
+        ax.fill_between(sessions, 
+                        female_means - female_sem, 
+                        female_means + female_sem, 
+                        color='yellow', alpha=0.2)
+    
+    ax.set_xlabel('Session Number', fontsize=14)
+    ax.set_ylabel('Mean Latency to Fall (seconds)', fontsize=14)
+    ax.set_title('Rotarod Learning Curves - Sex Comparison', fontsize=18, fontweight='bold')
+    ax.legend(fontsize=12)
+    ax.set_xticks(np.arange(1, 6, 1))  # Set integer ticks
+    ax.grid(True, alpha=0.3)
+    
+    # Save the plot (vector output; the constrained layout already fits the legend and labels)
+    output_path = os.path.join(PLOT_DIR, 'sex_comparison_learning_curves.svg')
+    _FIG.savefig(output_path)
     print(f"Saved sex comparison plot to: {output_path}")
-    plt.close()
+    # This is the last rotarod plot, so the shared figure is released here
+    _close_rotarod_figure()
     
     # Print summary statistics
     print("\n" + "="*50)
     print("Summary Statistics")
     print("="*50)
-    print(f"Males: n={len(males['Subject_ID'].unique())}")
-    print(f"Females: n={len(females['Subject_ID'].unique())}")
+    print(f"Males: n={subjects_per_sex.get('M', 0)}")
+    print(f"Females: n={subjects_per_sex.get('F', 0)}")
     print("\nMean latency to fall by session:")
     print("\nMales:")
     print(male_means)
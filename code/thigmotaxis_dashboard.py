@@ -10,43 +10,36 @@ import os
 import sys
 
 # Import analysis and plotting functions from their respective modules
-import data_loader
 import behavioral_analysis as analysis
+import analysis_pipeline
+import dashboard_driver
 import behavioral_plotting as plotting
 
-def generate_thigmotaxis_dashboard(start_sec=3, end_sec=603, bin_size=150):
+def generate_thigmotaxis_dashboard(start_sec=3, end_sec=603, bin_size=150, results=None):
     """
     Orchestrates the analysis and plotting of the thigmotaxis index dashboard.
-    """
-    print("\n--- Generating Thigmotaxis Index Dashboard ---")
-
-    # 1. Load data for all animals
-    raw_data = data_loader.load_matlab_data()
-    loaded_data = {unit: data for unit, data in raw_data.items() if data is not None}
-
-    if not loaded_data:
-        print("Error: No data files were successfully loaded. Cannot generate dashboard.")
-        return
 
-    # 2. Run thigmotaxis analysis for all animals
-    all_thigmotaxis_data = {}
-    bin_centers = np.array([])
+    Args:
+        start_sec (int): The start time in seconds for the analysis window.
+        end_sec (int): The end time in seconds for the analysis window.
+        bin_size (int): The size of each analysis bin in seconds.
+        results (dict): Output of analysis_pipeline.compute_all for the same window. If given,
+                        the data is not loaded or analyzed again.
 
-    for unit, data in loaded_data.items():
-        indices, bins = analysis.calculate_thigmotaxis_in_window(data, bin_size, start_sec, end_sec)
-        all_thigmotaxis_data[unit] = indices
-        if bin_centers.size == 0 and bins.size > 0:
-            bin_centers = bins
+    Returns:
+        dict: The compute_all results, for reuse by other dashboards (None if no data was loaded).
+    """
+    print("\n--- Generating Thigmotaxis Index Dashboard ---")
 
-    # 3. Plot the dashboard if analysis yielded data
-    if all_thigmotaxis_data and bin_centers.size > 0:
-        plotting.plot_thigmotaxis_by_group(all_thigmotaxis_data, bin_centers)
+    def plot(results):
+        bin_centers = results['bin_centers']
+        plotting.plot_thigmotaxis_by_group(analysis_pipeline.by_unit(results, 'thigmotaxis'), bin_centers)
 
-        # 4. Calculate and plot mean thigmotaxis by sex
-        male_mean, female_mean = analysis.calculate_mean_thigmotaxis_by_sex(all_thigmotaxis_data)
+        # Mean thigmotaxis by sex, straight from the per-animal matrix
+        male_mean, female_mean = analysis.calculate_mean_by_sex(results['unit_ids'], results['thigmotaxis'])
         plotting.plot_mean_thigmotaxis_by_sex(male_mean, female_mean, bin_centers)
-    else:
-        print("Error: Thigmotaxis analysis resulted in no data to plot.")
+
+    return dashboard_driver.run_dashboard(plot, start_sec, end_sec, bin_size, results)
 
 if __name__ == '__main__':
     generate_thigmotaxis_dashboard()